@@ -9,37 +9,28 @@ if ! command -v pyinstaller &> /dev/null; then
 fi
 
 # Clean previous builds
-rm -rf dist/ build/ *.spec
+rm -rf dist/ build/
 
-# Build the executable
+# Build the executable (one-dir bundle, see pymodoro.spec)
 echo "🔨 Creating executable..."
-pyinstaller \
-    --onefile \
-    --windowed \
-    --name=pymodoro \
-    --add-data="pymodoro:pymodoro" \
-    --hidden-import=pynput.keyboard._xorg \
-    --hidden-import=pynput.mouse._xorg \
-    --hidden-import=PyQt6.QtCore \
-    --hidden-import=PyQt6.QtWidgets \
-    --hidden-import=PyQt6.QtGui \
-    run.py
+pyinstaller --noconfirm pymodoro.spec
 
-if [ -f "dist/pymodoro" ]; then
-    chmod +x dist/pymodoro
-    SIZE=$(du -h dist/pymodoro | cut -f1)
+if [ -f "dist/pymodoro/pymodoro" ]; then
+    chmod +x dist/pymodoro/pymodoro
+    SIZE=$(du -sh dist/pymodoro | cut -f1)
     echo ""
     echo "🎉 BUILD SUCCESSFUL!"
-    echo "📦 Executable: dist/pymodoro"
+    echo "📦 Executable: dist/pymodoro/pymodoro"
     echo "📏 Size: $SIZE"
     echo ""
     echo "To install system-wide:"
-    echo "  sudo cp dist/pymodoro /usr/local/bin/"
+    echo "  sudo cp -r dist/pymodoro /opt/"
+    echo "  sudo ln -sf /opt/pymodoro/pymodoro /usr/local/bin/pymodoro"
     echo ""
     echo "To add to applications menu:"
     echo "  cp pymodoro.desktop ~/.local/share/applications/"
     echo ""
-    echo "Run with: ./dist/pymodoro"
+    echo "Run with: ./dist/pymodoro/pymodoro"
 else
     echo "❌ Build failed!"
     exit 1
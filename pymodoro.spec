@@ -1,34 +1,35 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+# One-dir build: modules are loaded from the bundled PYZ archive next to the
+# executable instead of being unpacked to a temp dir on every launch (as
+# --onefile does). optimize=2 ships bytecode without asserts and docstrings.
 
 a = Analysis(
     ['run.py'],
     pathex=[],
     binaries=[],
-    datas=[('pymodoro', 'pymodoro')],
+    datas=[],
     hiddenimports=['pynput.keyboard._xorg', 'pynput.mouse._xorg', 'PyQt6.QtCore', 'PyQt6.QtWidgets', 'PyQt6.QtGui'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
     excludes=[],
     noarchive=False,
-    optimize=0,
+    optimize=2,
 )
 pyz = PYZ(a.pure)
 
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='pymodoro',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
     upx_exclude=[],
-    runtime_tmpdir=None,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -36,3 +37,13 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='pymodoro',
+)
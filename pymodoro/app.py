@@ -2,7 +2,7 @@ import sys
 import signal
 import logging
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from .config.provider import ConfigProvider
 from .timer.core import PomodoroTimer
@@ -10,12 +10,11 @@ from .timer.controller import TimerController
 from .timer.states import TimerState
 from .gui.main_window import MainWindow
 from .gui.tray import SystemTray
-from .gui.overlay import BreakOverlay
 from .input.monitor import InputMonitor
-from .input.hotkeys import GlobalHotkeyManager
-from .audio.manager import AudioManager, SoundEvent
 from .utils.logger import get_logger
 
+_BREAK_STATES = frozenset({TimerState.SHORT_BREAK, TimerState.LONG_BREAK})
+
 class PyomodoroApp(QObject):
     quit_requested = pyqtSignal()
     
@@ -41,16 +40,18 @@ class PyomodoroApp(QObject):
         self.system_tray = SystemTray(self.timer, self.timer_controller, self.main_window)
         self.logger.debug("System tray initialized")
         
-        self.break_overlay = BreakOverlay(self.timer)
+        from .gui.overlay import BreakOverlay
+        self.break_overlay = BreakOverlay(self.timer, self.timer_controller)
         self.logger.debug("Break overlay created")
         
         self.input_manager = InputMonitor(self.config)
         self.logger.debug("Input monitor initialized")
         
-        self.audio_manager = AudioManager()
-        self.audio_manager.set_enabled(self.config.enable_sounds)
-        self.audio_manager.set_volume(self.config.sound_volume)
-        self.logger.debug("Audio manager initialized")
+        self.audio_manager = None
+        self._state_sounds = {}
+        self._completion_sounds = {}
+        if self.config.enable_sounds:
+            self._setup_audio()
         
         self.hotkey_manager = None
         if self.config.enable_global_hotkey:
@@ -61,7 +62,21 @@ class PyomodoroApp(QObject):
         
         self.logger.info("Pymodoro application initialized successfully")
     
+    def _setup_audio(self):
+        from .audio.manager import AudioManager, SoundEvent
+        self.audio_manager = AudioManager()
+        self.audio_manager.set_enabled(self.config.enable_sounds)
+        self.audio_manager.set_volume(self.config.sound_volume)
+        
+        # State -> sound lookups, so handlers need no branching per event
+        self._state_sounds = {TimerState.WORK: SoundEvent.WORK_START}
+        self._state_sounds.update(dict.fromkeys(_BREAK_STATES, SoundEvent.BREAK_START))
+        self._completion_sounds = {TimerState.WORK: SoundEvent.SESSION_COMPLETE}
+        self._completion_sounds.update(dict.fromkeys(_BREAK_STATES, SoundEvent.TIMER_FINISH))
+        self.logger.debug("Audio manager initialized")
+    
     def _setup_global_hotkey(self):
+        from .input.hotkeys import GlobalHotkeyManager
         try:
             self.hotkey_manager = GlobalHotkeyManager(self.config)
             self.hotkey_manager.hotkey_triggered.connect(self._on_global_hotkey)
@@ -78,13 +93,15 @@ class PyomodoroApp(QObject):
         self.timer.session_completed.connect(self._on_session_completed)
         self.logger.debug("Application signals connected")
     
+    @pyqtSlot()
     def _on_user_activity(self):
         if self.timer.current_state == TimerState.IDLE:
             self.logger.info("Auto-starting work session due to user activity")
             self.timer.start_work_session()
     
+    @pyqtSlot(TimerState)
     def _on_timer_state_changed(self, state):
-        self.logger.debug(f"Timer state changed to: {state.value}")
+        self.logger.debug("Timer state changed to: %s", state.value)
         
         # Handle input monitoring
         if state == TimerState.IDLE:
@@ -93,19 +110,18 @@ class PyomodoroApp(QObject):
             self.input_manager.stop_monitoring()
         
         # Handle audio events
-        if state == TimerState.WORK:
-            self.audio_manager.play_sound(SoundEvent.WORK_START)
-        elif state in [TimerState.SHORT_BREAK, TimerState.LONG_BREAK]:
-            self.audio_manager.play_sound(SoundEvent.BREAK_START)
+        event = self._state_sounds.get(state)
+        if event is not None:
+            self.audio_manager.play_sound(event)
     
+    @pyqtSlot(TimerState)
     def _on_session_completed(self, completed_state):
         """Handle session completion audio"""
-        self.logger.debug(f"Session completed: {completed_state.value}")
+        self.logger.debug("Session completed: %s", completed_state.value)
         
-        if completed_state == TimerState.WORK:
-            self.audio_manager.play_sound(SoundEvent.SESSION_COMPLETE)
-        elif completed_state in [TimerState.SHORT_BREAK, TimerState.LONG_BREAK]:
-            self.audio_manager.play_sound(SoundEvent.TIMER_FINISH)
+        event = self._completion_sounds.get(completed_state)
+        if event is not None:
+            self.audio_manager.play_sound(event)
     
     def _cleanup_global_hotkey(self):
         if self.hotkey_manager:
@@ -116,6 +132,7 @@ class PyomodoroApp(QObject):
             except Exception as e:
                 self.logger.error(f"Error cleaning up global hotkey: {e}")
     
+    @pyqtSlot()
     def _on_global_hotkey(self):
         self.logger.info("Global hotkey triggered")
         self.timer.start_work_session(from_hotkey=True)
@@ -145,8 +162,9 @@ class PyomodoroApp(QObject):
             self._cleanup_global_hotkey()
         
         self.input_manager.stop_monitoring()
+        self.config.flush()
         
-        if hasattr(self, 'audio_manager'):
+        if self.audio_manager:
             self.audio_manager.cleanup()
         
         self.quit_requested.emit() 
\ No newline at end of file
@@ -1,9 +1,11 @@
 import os
 import subprocess
+import threading
+import wave
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from enum import Enum
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
 from ..config.provider import ConfigProvider
 from ..utils.logger import get_logger
@@ -21,18 +23,76 @@ class SoundType(Enum):
     CHIMES = "chimes"
     CUSTOM = "custom"
 
-class AudioPlaybackThread(QThread):
-    """Background thread for playing audio without blocking UI"""
+class StreamPlayer:
+    """Long-lived paplay process fed raw 16-bit mono PCM over stdin
     
-    def __init__(self, sound_path: str, volume: float = 1.0):
+    Avoids spawning a player and reconnecting to PulseAudio for every sound.
+    """
+    
+    def __init__(self, sample_rate: int):
+        self.command = ['paplay', '--raw', f'--rate={sample_rate}', '--channels=1', '--format=s16le']
+        self.process: Optional[subprocess.Popen] = None
+        self.lock = threading.Lock()
+        self.logger = get_logger()
+    
+    def start(self) -> bool:
+        """Start the player process if it is not running"""
+        if self.process and self.process.poll() is None:
+            return True
+        try:
+            self.process = subprocess.Popen(self.command, stdin=subprocess.PIPE, bufsize=-1,
+                                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return True
+        except OSError as e:
+            self.logger.debug(f"Persistent audio player unavailable: {e}")
+            self.process = None
+            return False
+    
+    def write(self, pcm: bytes) -> bool:
+        """Queue PCM data for playback, returns False if the player is unusable"""
+        with self.lock:
+            if not self.start():
+                return False
+            try:
+                self.process.stdin.write(pcm)
+                self.process.stdin.flush()
+                return True
+            except (BrokenPipeError, OSError, ValueError):
+                self.process = None
+                return False
+    
+    def close(self):
+        """Stop the player process"""
+        process, self.process = self.process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        process.terminate()
+        try:
+            process.wait(1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+class AudioPlaybackTask(QRunnable):
+    """Background task for playing audio without blocking UI"""
+    
+    def __init__(self, sound_path: str, volume: float = 1.0,
+                 pcm: Optional[bytes] = None, player: Optional[StreamPlayer] = None):
         super().__init__()
         self.sound_path = sound_path
         self.volume = volume
+        self.pcm = pcm
+        self.player = player
         self.logger = get_logger()
     
     def run(self):
         """Play sound in background thread"""
         try:
+            if self.pcm is not None and self.player and self.player.write(self.pcm):
+                return
             self._play_file_sound(self.sound_path)
         except Exception as e:
             self.logger.error(f"Audio playback failed: {e}")
@@ -43,15 +103,16 @@ class AudioPlaybackThread(QThread):
             self.logger.error(f"Sound file not found: {file_path}")
             return
             
+        quiet = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.DEVNULL}
         try:
-            subprocess.run(['paplay', file_path], check=False, capture_output=True)
+            subprocess.run(['paplay', file_path], check=False, **quiet)
         except FileNotFoundError:
             try:
-                subprocess.run(['aplay', file_path], check=False, capture_output=True)
+                subprocess.run(['aplay', file_path], check=False, **quiet)
             except FileNotFoundError:
                 try:
                     subprocess.run(['ffplay', '-nodisp', '-autoexit', file_path], 
-                                 check=False, capture_output=True)
+                                 check=False, **quiet)
                 except FileNotFoundError:
                     self.logger.error("No audio player available (tried paplay, aplay, ffplay)")
 
@@ -69,8 +130,12 @@ class AudioManager(QObject):
         self.tone_generator = ToneGenerator()
         self.chime_sounds = {}
         self.sound_mappings: Dict[SoundEvent, str] = {}
+        # Playable events only, resolved once to (file path, preloaded PCM or None)
+        self._playback: Dict[SoundEvent, Tuple[str, Optional[bytes]]] = {}
+        self.player = StreamPlayer(self.tone_generator.sample_rate)
         
-        self.active_threads = []
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(2)
         self._setup_sounds()
     
     def _setup_sounds(self):
@@ -90,11 +155,28 @@ class AudioManager(QObject):
                 SoundEvent.SESSION_COMPLETE: self.chime_sounds['session_complete'],
                 SoundEvent.TIMER_FINISH: self.chime_sounds['timer_finish']
             }
+            self._playback = {event: (path, self._read_pcm(path))
+                              for event, path in self.sound_mappings.items()}
+            self.player.start()
             self.logger.info("Generated chime sounds successfully")
         except Exception as e:
             self.logger.error(f"Failed to generate chime sounds: {e}")
+            self._playback = {}
             self.enabled = False
     
+    def _read_pcm(self, file_path: str) -> Optional[bytes]:
+        """Read raw PCM frames of a WAV file in the stream player's format, else None"""
+        if not file_path.lower().endswith('.wav'):
+            return None
+        try:
+            with wave.open(file_path, 'rb') as wav_file:
+                if (wav_file.getnchannels(), wav_file.getsampwidth(), wav_file.getframerate()) != \
+                        (1, 2, self.tone_generator.sample_rate):
+                    return None
+                return wav_file.readframes(wav_file.getnframes())
+        except (wave.Error, EOFError, OSError):
+            return None
+    
     def _setup_custom_sounds(self):
         """Setup custom sound file mappings"""
         self.sound_mappings = {
@@ -104,15 +186,22 @@ class AudioManager(QObject):
             SoundEvent.TIMER_FINISH: self.config.timer_finish_sound
         }
         
-        # Check if custom files exist
+        # Check if custom files exist once, so playback can trust the result
+        self._playback = {}
         missing_files = []
         for event, file_path in self.sound_mappings.items():
-            if file_path and not Path(file_path).exists():
+            if not file_path:
+                continue
+            if Path(file_path).exists():
+                self._playback[event] = (file_path, self._read_pcm(file_path))
+            else:
                 missing_files.append(f"{event.value}: {file_path}")
         
         if missing_files:
             self.logger.warning(f"Custom sound files not found: {missing_files}")
         
+        if any(pcm is not None for _, pcm in self._playback.values()):
+            self.player.start()
         self.logger.info("Custom sound mappings configured")
     
     def play_sound(self, event: SoundEvent):
@@ -120,27 +209,15 @@ class AudioManager(QObject):
         if not self.enabled:
             return
             
-        sound_path = self.sound_mappings.get(event)
-        if not sound_path:
-            self.logger.debug(f"No sound configured for event: {event.value}")
-            return
-        
-        # For custom sounds, check if file exists
-        if self.sound_type == SoundType.CUSTOM and not Path(sound_path).exists():
-            self.logger.warning(f"Sound file not found: {sound_path}")
+        playback = self._playback.get(event)
+        if playback is None:
+            self.logger.debug("No playable sound configured for event: %s", event.value)
             return
             
-        self.logger.debug(f"Playing sound for event: {event.value}")
+        self.logger.debug("Playing sound for event: %s", event.value)
         
-        thread = AudioPlaybackThread(sound_path, self.volume)
-        thread.finished.connect(lambda: self._cleanup_thread(thread))
-        self.active_threads.append(thread)
-        thread.start()
-    
-    def _cleanup_thread(self, thread: AudioPlaybackThread):
-        """Clean up finished audio thread"""
-        if thread in self.active_threads:
-            self.active_threads.remove(thread)
+        sound_path, pcm = playback
+        self.pool.start(AudioPlaybackTask(sound_path, self.volume, pcm, self.player))
     
     def set_enabled(self, enabled: bool):
         """Enable/disable audio"""
@@ -150,7 +227,7 @@ class AudioManager(QObject):
     def set_volume(self, volume: float):
         """Set audio volume (0.0 to 1.0)"""
         self.volume = max(0.0, min(1.0, volume))
-        self.logger.debug(f"Audio volume set to {self.volume:.1%}")
+        self.logger.debug("Audio volume set to %.1f%%", self.volume * 100)
     
     def set_sound_type(self, sound_type: SoundType):
         """Set sound type (chimes/custom)"""
@@ -162,6 +239,7 @@ class AudioManager(QObject):
         """Set custom sound file for event"""
         if Path(file_path).exists():
             self.sound_mappings[event] = file_path
+            self._playback[event] = (file_path, self._read_pcm(file_path))
             self.logger.info(f"Custom sound set for {event.value}: {file_path}")
         else:
             self.logger.error(f"Sound file not found: {file_path}")
@@ -172,16 +250,14 @@ class AudioManager(QObject):
         self.play_sound(event)
     
     def stop_all_sounds(self):
-        """Stop all currently playing sounds"""
-        for thread in self.active_threads[:]:
-            if thread.isRunning():
-                thread.terminate()
-                thread.wait(1000)
-            self._cleanup_thread(thread)
+        """Stop all queued sounds and wait briefly for playing ones to finish"""
+        self.pool.clear()
+        self.pool.waitForDone(1000)
         self.logger.debug("All sounds stopped")
     
     def cleanup(self):
         """Clean up resources"""
         self.stop_all_sounds()
+        self.player.close()
         if hasattr(self, 'tone_generator'):
             self.tone_generator.cleanup() 
\ No newline at end of file
@@ -1,9 +1,29 @@
-import math
 import wave
-import struct
+import hashlib
 import tempfile
 import os
-from typing import List, Tuple
+from pathlib import Path
+from typing import List, Tuple, TYPE_CHECKING
+
+# NumPy is imported inside the synthesis methods: warm starts reuse cached
+# chime files and never need it, which saves its import time
+if TYPE_CHECKING:
+    import numpy as np
+
+# Bump when the synthesis code changes so cached chime files are regenerated
+CHIME_VERSION = 1
+
+# Chord frequencies (Hz) and duration (s) for each timer event
+CHIMES = {
+    # Work start - Uplifting major chord (C major)
+    'work_start': ((261.63, 329.63, 392.00), 1.0),  # C4, E4, G4
+    # Break start - Relaxing minor chord (A minor)
+    'break_start': ((220.00, 261.63, 329.63), 1.2),  # A3, C4, E4
+    # Session complete - Achievement sound (Perfect fifth + octave)
+    'session_complete': ((261.63, 392.00, 523.25), 1.5),  # C4, G4, C5
+    # Timer finish - Gentle notification (Single tone with harmonics)
+    'timer_finish': ((440.00, 880.00), 0.8),  # A4, A5
+}
 
 class ToneGenerator:
     """Generate pleasant chime tones for timer events"""
@@ -12,107 +32,87 @@ class ToneGenerator:
         self.sample_rate = sample_rate
         self.temp_files = []
     
-    def generate_sine_wave(self, frequency: float, duration: float, amplitude: float = 0.5) -> List[float]:
+    def generate_sine_wave(self, frequency: float, duration: float, amplitude: float = 0.5) -> 'np.ndarray':
         """Generate a sine wave at given frequency and duration"""
-        samples = []
-        for i in range(int(self.sample_rate * duration)):
-            t = i / self.sample_rate
-            sample = amplitude * math.sin(2 * math.pi * frequency * t)
-            samples.append(sample)
-        return samples
+        import numpy as np
+        n = int(self.sample_rate * duration)
+        t = np.arange(n, dtype=np.float32) * (1.0 / self.sample_rate)
+        return amplitude * np.sin(2 * np.pi * frequency * t)
     
-    def apply_envelope(self, samples: List[float], attack: float = 0.1, decay: float = 0.2, 
-                      sustain: float = 0.7, release: float = 0.3) -> List[float]:
+    def apply_envelope(self, samples: 'np.ndarray', attack: float = 0.1, decay: float = 0.2, 
+                      sustain: float = 0.7, release: float = 0.3) -> 'np.ndarray':
         """Apply ADSR envelope to samples for natural sound"""
+        import numpy as np
         total_samples = len(samples)
         attack_samples = int(attack * total_samples)
         decay_samples = int(decay * total_samples)
         release_samples = int(release * total_samples)
         sustain_samples = total_samples - attack_samples - decay_samples - release_samples
         
-        enveloped = []
-        
-        for i, sample in enumerate(samples):
-            if i < attack_samples:
-                # Attack phase
-                envelope = i / attack_samples
-            elif i < attack_samples + decay_samples:
-                # Decay phase
-                envelope = 1.0 - (1.0 - sustain) * (i - attack_samples) / decay_samples
-            elif i < attack_samples + decay_samples + sustain_samples:
-                # Sustain phase
-                envelope = sustain
-            else:
-                # Release phase
-                envelope = sustain * (1.0 - (i - attack_samples - decay_samples - sustain_samples) / release_samples)
-            
-            enveloped.append(sample * envelope)
+        envelope = np.concatenate([
+            np.linspace(0.0, 1.0, attack_samples, endpoint=False, dtype=np.float32),  # Attack phase
+            np.linspace(1.0, sustain, decay_samples, endpoint=False, dtype=np.float32),  # Decay phase
+            np.full(sustain_samples, sustain, dtype=np.float32),  # Sustain phase
+            np.linspace(sustain, 0.0, release_samples, endpoint=False, dtype=np.float32),  # Release phase
+        ])
         
-        return enveloped
+        return samples * envelope
     
-    def create_chord(self, frequencies: List[float], duration: float) -> List[float]:
+    def create_chord(self, frequencies: List[float], duration: float) -> 'np.ndarray':
         """Create a chord by mixing multiple frequencies"""
-        chord_samples = []
-        for freq in frequencies:
-            samples = self.generate_sine_wave(freq, duration, amplitude=0.3)
-            if not chord_samples:
-                chord_samples = samples
-            else:
-                for i in range(len(samples)):
-                    chord_samples[i] += samples[i]
+        import numpy as np
+        n = int(self.sample_rate * duration)
+        t = np.arange(n, dtype=np.float32) * (1.0 / self.sample_rate)
+        freqs = np.asarray(frequencies, dtype=np.float32)[:, None]
+        chord_samples = (0.3 * np.sin(2 * np.pi * freqs * t)).sum(axis=0)
         
         # Normalize to prevent clipping
-        max_amplitude = max(abs(s) for s in chord_samples)
-        if max_amplitude > 1.0:
-            chord_samples = [s / max_amplitude for s in chord_samples]
+        chord_samples *= 1.0 / max(1.0, np.abs(chord_samples).max())
         
         return self.apply_envelope(chord_samples)
     
-    def save_wav_file(self, samples: List[float], filename: str) -> str:
+    def save_wav_file(self, samples: 'np.ndarray', filename: str) -> str:
         """Save samples as WAV file"""
+        import numpy as np
         with wave.open(filename, 'w') as wav_file:
             wav_file.setnchannels(1)  # Mono
             wav_file.setsampwidth(2)  # 16-bit
             wav_file.setframerate(self.sample_rate)
             
             # Convert float samples to 16-bit integers
-            for sample in samples:
-                wav_file.writeframes(struct.pack('<h', int(sample * 32767)))
+            pcm = np.clip(samples * 32767, -32768, 32767).astype('<i2')
+            wav_file.writeframes(pcm.tobytes())
         
         return filename
     
     def create_chime_sounds(self) -> dict:
-        """Create pleasant chime sounds for different timer events"""
-        temp_dir = tempfile.gettempdir()
-        sounds = {}
+        """Create pleasant chime sounds for different timer events
         
-        # Work start - Uplifting major chord (C major)
-        work_chord = [261.63, 329.63, 392.00]  # C4, E4, G4
-        work_samples = self.create_chord(work_chord, 1.0)
-        work_file = os.path.join(temp_dir, 'pymodoro_work_start.wav')
-        sounds['work_start'] = self.save_wav_file(work_samples, work_file)
-        self.temp_files.append(work_file)
+        Generated files are cached under ~/.cache/pymodoro keyed by the chime
+        parameters, so later launches reuse them instead of regenerating.
+        """
+        params = (CHIME_VERSION, self.sample_rate, CHIMES)
+        key = hashlib.blake2b(repr(params).encode(), digest_size=8).hexdigest()
+        cache_dir = Path.home() / '.cache' / 'pymodoro' / f'chimes_{key}'
         
-        # Break start - Relaxing minor chord (A minor)
-        break_chord = [220.00, 261.63, 329.63]  # A3, C4, E4
-        break_samples = self.create_chord(break_chord, 1.2)
-        break_file = os.path.join(temp_dir, 'pymodoro_break_start.wav')
-        sounds['break_start'] = self.save_wav_file(break_samples, break_file)
-        self.temp_files.append(break_file)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            is_cached = True
+        except OSError:
+            cache_dir = Path(tempfile.gettempdir())
+            is_cached = False
         
-        # Session complete - Achievement sound (Perfect fifth + octave)
-        complete_chord = [261.63, 392.00, 523.25]  # C4, G4, C5
-        complete_samples = self.create_chord(complete_chord, 1.5)
-        complete_file = os.path.join(temp_dir, 'pymodoro_session_complete.wav')
-        sounds['session_complete'] = self.save_wav_file(complete_samples, complete_file)
-        self.temp_files.append(complete_file)
-        
-        # Timer finish - Gentle notification (Single tone with harmonics)
-        finish_chord = [440.00, 880.00]  # A4, A5
-        finish_samples = self.create_chord(finish_chord, 0.8)
-        finish_file = os.path.join(temp_dir, 'pymodoro_timer_finish.wav')
-        sounds['timer_finish'] = self.save_wav_file(finish_samples, finish_file)
-        self.temp_files.append(finish_file)
+        sounds = {}
+        for name, (frequencies, duration) in CHIMES.items():
+            sound_file = cache_dir / f'pymodoro_{name}.wav'
+            if not (is_cached and sound_file.exists()):
+                samples = self.create_chord(list(frequencies), duration)
+                tmp_file = sound_file.with_suffix('.tmp')
+                self.save_wav_file(samples, str(tmp_file))
+                os.replace(tmp_file, sound_file)
+                if not is_cached:
+                    self.temp_files.append(str(sound_file))
+            sounds[name] = str(sound_file)
         
         return sounds
     
@@ -1,8 +1,11 @@
-import json
+import msgspec
 from pathlib import Path
 from typing import Optional
 from .models import PomodoroConfig, AppState
 
+def _encode(obj) -> bytes:
+    return msgspec.json.format(msgspec.json.encode(obj), indent=2)
+
 class ConfigManager:
     def __init__(self, config_dir: Optional[Path] = None):
         if config_dir is None:
@@ -20,27 +23,21 @@ class ConfigManager:
     def load_config(self) -> PomodoroConfig:
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                return PomodoroConfig(**data)
-            except (json.JSONDecodeError, ValueError):
+                return msgspec.json.decode(self.config_file.read_bytes(), type=PomodoroConfig)
+            except msgspec.DecodeError:
                 pass
         return PomodoroConfig()
     
     def save_config(self):
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config.model_dump(), f, indent=2)
+        self.config_file.write_bytes(_encode(self.config))
     
     def load_state(self) -> AppState:
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                return AppState(**data)
-            except (json.JSONDecodeError, ValueError):
+                return msgspec.json.decode(self.state_file.read_bytes(), type=AppState)
+            except msgspec.DecodeError:
                 pass
         return AppState()
     
     def save_state(self):
-        with open(self.state_file, 'w') as f:
-            json.dump(self.state.model_dump(), f, indent=2) 
\ No newline at end of file
+        self.state_file.write_bytes(_encode(self.state))
\ No newline at end of file
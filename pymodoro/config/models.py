@@ -1,27 +1,29 @@
-from pydantic import BaseModel, Field
+from typing import Annotated
 
-class PomodoroConfig(BaseModel):
-    work_duration: int = Field(default=25, ge=1, le=120)
-    short_break_duration: int = Field(default=5, ge=1, le=60)
-    long_break_duration: int = Field(default=15, ge=5, le=120)
-    sessions_until_long_break: int = Field(default=4, ge=2, le=10)
-    auto_start_work_after_break: bool = Field(default=True)
-    enable_global_hotkey: bool = Field(default=False)
-    global_hotkey: str = Field(default="ctrl+alt+space")
+import msgspec
+from msgspec import Meta
+
+from ..timer.states import TimerState
+
+class PomodoroConfig(msgspec.Struct):
+    work_duration: Annotated[int, Meta(ge=1, le=120)] = 25
+    short_break_duration: Annotated[int, Meta(ge=1, le=60)] = 5
+    long_break_duration: Annotated[int, Meta(ge=5, le=120)] = 15
+    sessions_until_long_break: Annotated[int, Meta(ge=2, le=10)] = 4
+    auto_start_work_after_break: bool = True
+    enable_global_hotkey: bool = False
+    global_hotkey: str = "ctrl+alt+space"
     
     # Audio settings
-    enable_sounds: bool = Field(default=True)
-    sound_volume: float = Field(default=0.7, ge=0.0, le=1.0)
-    sound_type: str = Field(default="chimes")  # "chimes", "custom"
-    work_start_sound: str = Field(default="")
-    break_start_sound: str = Field(default="")
-    session_complete_sound: str = Field(default="")
-    timer_finish_sound: str = Field(default="")
-
-    class Config:
-        env_prefix = "PYMODORO_"
+    enable_sounds: bool = True
+    sound_volume: Annotated[float, Meta(ge=0.0, le=1.0)] = 0.7
+    sound_type: str = "chimes"  # "chimes", "custom"
+    work_start_sound: str = ""
+    break_start_sound: str = ""
+    session_complete_sound: str = ""
+    timer_finish_sound: str = ""
 
-class AppState(BaseModel):
-    current_session: int = Field(default=1)
-    total_sessions_completed: int = Field(default=0)
-    current_state: str = Field(default="IDLE") 
\ No newline at end of file
+class AppState(msgspec.Struct):
+    current_session: int = 1
+    total_sessions_completed: int = 0
+    current_state: TimerState = TimerState.IDLE
\ No newline at end of file
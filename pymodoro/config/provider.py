@@ -5,111 +5,58 @@ Eliminates all hasattr() checks by providing a clean, consistent API
 regardless of whether we're in normal mode or test mode.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional
-import json
+from typing import Optional, Protocol
+import os
 from pathlib import Path
+import msgspec
+from PyQt6.QtCore import QTimer
 from .models import PomodoroConfig
-from .manager import ConfigManager
+from .manager import ConfigManager, _encode
 
 
-class BaseConfig(ABC):
-    """Base configuration interface - provides consistent API for all config types"""
-    
-    @property
-    @abstractmethod
-    def work_duration_seconds(self) -> int:
-        """Work session duration in seconds"""
-        pass
-    
-    @property
-    @abstractmethod
-    def short_break_duration_seconds(self) -> int:
-        """Short break duration in seconds"""
-        pass
-    
-    @property
-    @abstractmethod
-    def long_break_duration_seconds(self) -> int:
-        """Long break duration in seconds"""
-        pass
-    
-    @property
-    @abstractmethod
-    def work_duration(self) -> int:
-        """Work session duration in minutes (for display)"""
-        pass
-    
-    @property
-    @abstractmethod
-    def short_break_duration(self) -> int:
-        """Short break duration in minutes (for display)"""
-        pass
-    
-    @property
-    @abstractmethod
-    def long_break_duration(self) -> int:
-        """Long break duration in minutes (for display)"""
-        pass
-    
-    @property
-    @abstractmethod
-    def sessions_until_long_break(self) -> int:
-        pass
-    
-    @property
-    @abstractmethod
-    def auto_start_work_after_break(self) -> bool:
-        pass
-    
-    @property
-    @abstractmethod
-    def enable_global_hotkey(self) -> bool:
-        pass
-    
-    @property
-    @abstractmethod
-    def global_hotkey(self) -> str:
-        pass
-    
-    @property
-    @abstractmethod
-    def enable_sounds(self) -> bool:
-        pass
-    
-    @property
-    @abstractmethod
-    def sound_volume(self) -> float:
-        pass
-    
-    @property
-    @abstractmethod
-    def sound_type(self) -> str:
-        pass
-    
-    @property
-    @abstractmethod
-    def work_start_sound(self) -> str:
-        pass
-    
-    @property
-    @abstractmethod
-    def break_start_sound(self) -> str:
-        pass
-    
-    @property
-    @abstractmethod
-    def session_complete_sound(self) -> str:
-        pass
-    
-    @property
-    @abstractmethod
-    def timer_finish_sound(self) -> str:
-        pass
+# Delay used to coalesce a burst of setting updates into one write
+_SAVE_DELAY_MS = 50
+
+# Settings stored in minutes that also expose a derived *_seconds attribute
+_MINUTE_FIELDS = frozenset({'work_duration', 'short_break_duration', 'long_break_duration'})
+
+
+class BaseConfig(Protocol):
+    """Base configuration interface - provides consistent API for all config types
+    
+    Settings are plain instance attributes so reads are a single attribute
+    lookup; assigning a minute duration keeps its *_seconds value in sync.
+    """
+    
+    work_duration_seconds: int
+    short_break_duration_seconds: int
+    long_break_duration_seconds: int
+    work_duration: int  # minutes (for display)
+    short_break_duration: int
+    long_break_duration: int
+    sessions_until_long_break: int
+    auto_start_work_after_break: bool
+    enable_global_hotkey: bool
+    global_hotkey: str
+    enable_sounds: bool
+    sound_volume: float
+    sound_type: str
+    work_start_sound: str
+    break_start_sound: str
+    session_complete_sound: str
+    timer_finish_sound: str
+    
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in _MINUTE_FIELDS:
+            super().__setattr__(f'{name}_seconds', value * 60)
     
-    @abstractmethod
     def update_setting(self, key: str, value) -> None:
         """Update a setting and persist if necessary"""
+        ...
+    
+    def flush(self) -> None:
+        """Write out any pending setting changes"""
         pass
 
 
@@ -126,344 +73,107 @@ class PersistentConfig(BaseConfig):
         
         self.config_manager = ConfigManager()
         self.config = self.config_manager.config
+        self._dirty = False
+        self._last_payload = b''
+        for name in PomodoroConfig.__struct_fields__:
+            setattr(self, name, getattr(self.config, name))
     
-    def _load_config(self) -> PomodoroConfig:
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                return PomodoroConfig(**data)
-            except (json.JSONDecodeError, ValueError):
-                pass
-        return PomodoroConfig()
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in PomodoroConfig.__struct_fields__:
+            setattr(self.config, name, value)
     
     def _save_config(self):
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config.model_dump(), f, indent=2)
-    
-    @property
-    def work_duration_seconds(self) -> int:
-        return self.config.work_duration * 60
-    
-    @property
-    def short_break_duration_seconds(self) -> int:
-        return self.config.short_break_duration * 60
-    
-    @property
-    def long_break_duration_seconds(self) -> int:
-        return self.config.long_break_duration * 60
-    
-    @property
-    def work_duration(self) -> int:
-        return self.config.work_duration
-    
-    @work_duration.setter
-    def work_duration(self, value: int) -> None:
-        self.config.work_duration = value
-    
-    @property
-    def short_break_duration(self) -> int:
-        return self.config.short_break_duration
-    
-    @short_break_duration.setter
-    def short_break_duration(self, value: int) -> None:
-        self.config.short_break_duration = value
-    
-    @property
-    def long_break_duration(self) -> int:
-        return self.config.long_break_duration
-    
-    @long_break_duration.setter
-    def long_break_duration(self, value: int) -> None:
-        self.config.long_break_duration = value
-    
-    @property
-    def sessions_until_long_break(self) -> int:
-        return self.config.sessions_until_long_break
-    
-    @sessions_until_long_break.setter
-    def sessions_until_long_break(self, value: int) -> None:
-        self.config.sessions_until_long_break = value
-    
-    @property
-    def auto_start_work_after_break(self) -> bool:
-        return self.config.auto_start_work_after_break
-    
-    @auto_start_work_after_break.setter
-    def auto_start_work_after_break(self, value: bool) -> None:
-        self.config.auto_start_work_after_break = value
-    
-    @property
-    def enable_global_hotkey(self) -> bool:
-        return self.config.enable_global_hotkey
-    
-    @enable_global_hotkey.setter
-    def enable_global_hotkey(self, value: bool) -> None:
-        self.config.enable_global_hotkey = value
-    
-    @property
-    def global_hotkey(self) -> str:
-        return self.config.global_hotkey
-    
-    @global_hotkey.setter
-    def global_hotkey(self, value: str) -> None:
-        self.config.global_hotkey = value
-    
-    @property
-    def enable_sounds(self) -> bool:
-        return self.config.enable_sounds
-    
-    @enable_sounds.setter
-    def enable_sounds(self, value: bool) -> None:
-        self.config.enable_sounds = value
-    
-    @property
-    def sound_volume(self) -> float:
-        return self.config.sound_volume
-    
-    @sound_volume.setter
-    def sound_volume(self, value: float) -> None:
-        self.config.sound_volume = value
-    
-    @property
-    def sound_type(self) -> str:
-        return self.config.sound_type
-    
-    @sound_type.setter
-    def sound_type(self, value: str) -> None:
-        self.config.sound_type = value
-    
-    @property
-    def work_start_sound(self) -> str:
-        return self.config.work_start_sound
-    
-    @work_start_sound.setter
-    def work_start_sound(self, value: str) -> None:
-        self.config.work_start_sound = value
-    
-    @property
-    def break_start_sound(self) -> str:
-        return self.config.break_start_sound
-    
-    @break_start_sound.setter
-    def break_start_sound(self, value: str) -> None:
-        self.config.break_start_sound = value
-    
-    @property
-    def session_complete_sound(self) -> str:
-        return self.config.session_complete_sound
-    
-    @session_complete_sound.setter
-    def session_complete_sound(self, value: str) -> None:
-        self.config.session_complete_sound = value
-    
-    @property
-    def timer_finish_sound(self) -> str:
-        return self.config.timer_finish_sound
-    
-    @timer_finish_sound.setter
-    def timer_finish_sound(self, value: str) -> None:
-        self.config.timer_finish_sound = value
+        """Write the config atomically, skipping the write if nothing changed"""
+        payload = _encode(self.config)
+        if payload == self._last_payload:
+            return
+        tmp_file = self.config_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, self.config_file)
+        self._last_payload = payload
     
     def update_setting(self, key: str, value) -> None:
-        """Update a setting and save to file"""
-        setattr(self.config, key, value)
-        self.config_manager.save_config()
+        """Update a setting and schedule a save to file"""
+        setattr(self, key, value)
+        if not self._dirty:
+            self._dirty = True
+            QTimer.singleShot(_SAVE_DELAY_MS, self.flush)
+    
+    def flush(self) -> None:
+        """Save pending setting changes to file"""
+        if self._dirty:
+            self._dirty = False
+            self._save_config()
     
     def get_raw_config(self) -> PomodoroConfig:
-        """Get the underlying Pydantic config for compatibility"""
+        """Get the underlying PomodoroConfig struct for compatibility"""
         return self.config
 
 
+_DEFAULTS = msgspec.structs.asdict(PomodoroConfig())
+
+# Test-mode keys that give the minute durations in seconds
+_TEST_SECONDS_KEYS = {
+    'work_duration': '_work_seconds',
+    'short_break_duration': '_short_break_seconds',
+    'long_break_duration': '_long_break_seconds',
+}
+
+
 class InMemoryConfig(BaseConfig):
     """Test config - uses provided values, no persistence"""
     
     def __init__(self, test_values: dict):
-        # Set up defaults first
-        base_config = PomodoroConfig()
+        # Defaults merged with test values in one pass
+        values = dict(_DEFAULTS)
+        values.update((key, value) for key, value in test_values.items() if key in _DEFAULTS)
         
-        # Override with test values
-        self._work_seconds = test_values.get('_work_seconds', base_config.work_duration * 60)
-        self._short_break_seconds = test_values.get('_short_break_seconds', base_config.short_break_duration * 60)
-        self._long_break_seconds = test_values.get('_long_break_seconds', base_config.long_break_duration * 60)
+        # Test durations are given in seconds; minutes are derived for display
+        for name, seconds_key in _TEST_SECONDS_KEYS.items():
+            seconds = test_values.get(seconds_key, values[name] * 60)
+            values[name] = max(1, seconds // 60)
+            values[f'{name}_seconds'] = seconds
         
-        self._sessions_until_long_break = test_values.get('sessions_until_long_break', base_config.sessions_until_long_break)
-        self._auto_start_work_after_break = test_values.get('auto_start_work_after_break', base_config.auto_start_work_after_break)
-        self._enable_global_hotkey = test_values.get('enable_global_hotkey', base_config.enable_global_hotkey)
-        self._global_hotkey = test_values.get('global_hotkey', base_config.global_hotkey)
-        
-        # Audio settings
-        self._enable_sounds = test_values.get('enable_sounds', base_config.enable_sounds)
-        self._sound_volume = test_values.get('sound_volume', base_config.sound_volume)
-        self._sound_type = test_values.get('sound_type', base_config.sound_type)
-        self._work_start_sound = test_values.get('work_start_sound', base_config.work_start_sound)
-        self._break_start_sound = test_values.get('break_start_sound', base_config.break_start_sound)
-        self._session_complete_sound = test_values.get('session_complete_sound', base_config.session_complete_sound)
-        self._timer_finish_sound = test_values.get('timer_finish_sound', base_config.timer_finish_sound)
-    
-    @property
-    def work_duration_seconds(self) -> int:
-        return self._work_seconds
-    
-    @property
-    def short_break_duration_seconds(self) -> int:
-        return self._short_break_seconds
-    
-    @property
-    def long_break_duration_seconds(self) -> int:
-        return self._long_break_seconds
-    
-    @property
-    def work_duration(self) -> int:
-        return max(1, self._work_seconds // 60)
-    
-    @work_duration.setter
-    def work_duration(self, value: int) -> None:
-        self._work_seconds = value * 60
-    
-    @property
-    def short_break_duration(self) -> int:
-        return max(1, self._short_break_seconds // 60)
-    
-    @short_break_duration.setter
-    def short_break_duration(self, value: int) -> None:
-        self._short_break_seconds = value * 60
-    
-    @property
-    def long_break_duration(self) -> int:
-        return max(1, self._long_break_seconds // 60)
-    
-    @long_break_duration.setter
-    def long_break_duration(self, value: int) -> None:
-        self._long_break_seconds = value * 60
-    
-    @property
-    def sessions_until_long_break(self) -> int:
-        return self._sessions_until_long_break
-    
-    @sessions_until_long_break.setter
-    def sessions_until_long_break(self, value: int) -> None:
-        self._sessions_until_long_break = value
-    
-    @property
-    def auto_start_work_after_break(self) -> bool:
-        return self._auto_start_work_after_break
-    
-    @auto_start_work_after_break.setter
-    def auto_start_work_after_break(self, value: bool) -> None:
-        self._auto_start_work_after_break = value
-    
-    @property
-    def enable_global_hotkey(self) -> bool:
-        return self._enable_global_hotkey
-    
-    @enable_global_hotkey.setter
-    def enable_global_hotkey(self, value: bool) -> None:
-        self._enable_global_hotkey = value
-    
-    @property
-    def global_hotkey(self) -> str:
-        return self._global_hotkey
-    
-    @global_hotkey.setter
-    def global_hotkey(self, value: str) -> None:
-        self._global_hotkey = value
-    
-    @property
-    def enable_sounds(self) -> bool:
-        return self._enable_sounds
-    
-    @enable_sounds.setter
-    def enable_sounds(self, value: bool) -> None:
-        self._enable_sounds = value
-    
-    @property
-    def sound_volume(self) -> float:
-        return self._sound_volume
-    
-    @sound_volume.setter
-    def sound_volume(self, value: float) -> None:
-        self._sound_volume = value
-    
-    @property
-    def sound_type(self) -> str:
-        return self._sound_type
-    
-    @sound_type.setter
-    def sound_type(self, value: str) -> None:
-        self._sound_type = value
-    
-    @property
-    def work_start_sound(self) -> str:
-        return self._work_start_sound
-    
-    @work_start_sound.setter
-    def work_start_sound(self, value: str) -> None:
-        self._work_start_sound = value
-    
-    @property
-    def break_start_sound(self) -> str:
-        return self._break_start_sound
-    
-    @break_start_sound.setter
-    def break_start_sound(self, value: str) -> None:
-        self._break_start_sound = value
-    
-    @property
-    def session_complete_sound(self) -> str:
-        return self._session_complete_sound
-    
-    @session_complete_sound.setter
-    def session_complete_sound(self, value: str) -> None:
-        self._session_complete_sound = value
-    
-    @property
-    def timer_finish_sound(self) -> str:
-        return self._timer_finish_sound
-    
-    @timer_finish_sound.setter
-    def timer_finish_sound(self, value: str) -> None:
-        self._timer_finish_sound = value
+        # Seconds are already derived above, so bypass the __setattr__ sync
+        self.__dict__.update(values)
     
     def update_setting(self, key: str, value) -> None:
         """Update in-memory setting (no persistence in test mode)"""
-        setattr(self, f'_{key}', value)
+        setattr(self, key, value)
+
+
+_PROVIDER_CONFIG: Optional[BaseConfig] = None
+_TEST_MODE = False
 
 
 class ConfigProvider:
     """Singleton config provider - single access point for all configuration"""
     
-    _instance: Optional['ConfigProvider'] = None
-    _config: Optional[BaseConfig] = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
-    @classmethod
-    def initialize(cls, config: BaseConfig) -> None:
+    @staticmethod
+    def initialize(config: BaseConfig) -> None:
         """Initialize the provider with a specific config implementation"""
-        instance = cls()
-        instance._config = config
+        global _PROVIDER_CONFIG, _TEST_MODE
+        _PROVIDER_CONFIG = config
+        _TEST_MODE = isinstance(config, InMemoryConfig)
     
-    @classmethod
-    def get(cls) -> BaseConfig:
+    @staticmethod
+    def get() -> BaseConfig:
         """Get the current config instance"""
-        instance = cls()
-        if instance._config is None:
+        global _PROVIDER_CONFIG
+        if _PROVIDER_CONFIG is None:
             # Default to persistent config if not initialized
-            instance._config = PersistentConfig()
-        return instance._config
+            _PROVIDER_CONFIG = PersistentConfig()
+        return _PROVIDER_CONFIG
     
-    @classmethod
-    def is_test_mode(cls) -> bool:
+    @staticmethod
+    def is_test_mode() -> bool:
         """Check if we're running in test mode"""
-        instance = cls()
-        return isinstance(instance._config, InMemoryConfig)
+        return _TEST_MODE
     
-    @classmethod
-    def reset(cls) -> None:
+    @staticmethod
+    def reset() -> None:
         """Reset the singleton (useful for testing)"""
-        cls._instance = None
-        cls._config = None 
\ No newline at end of file
+        global _PROVIDER_CONFIG, _TEST_MODE
+        _PROVIDER_CONFIG = None
+        _TEST_MODE = False
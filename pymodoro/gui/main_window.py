@@ -1,9 +1,10 @@
+from typing import Optional
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QFrame, QCheckBox, QGroupBox)
 from PyQt6.QtCore import Qt, pyqtSlot
-from PyQt6.QtGui import QFont, QCloseEvent, QIcon
+from PyQt6.QtGui import QFont, QCloseEvent, QIcon, QShowEvent, QHideEvent
 from ..timer.states import TimerState
-from ..timer.core import PomodoroTimer
+from ..timer.core import PomodoroTimer, format_time
 from ..timer.controller import TimerController
 from ..config.provider import ConfigProvider
 from ..utils.logger import get_logger
@@ -17,6 +18,9 @@ class MainWindow(QMainWindow):
         self.config = ConfigProvider.get()
         self.logger = get_logger()
         self.tray_available = False
+        self._ticks_connected = False
+        self._idle_seconds: Optional[int] = None
+        self._idle_text = ""
         self.setup_ui()
         self.connect_signals()
         self.update_display()
@@ -97,7 +101,7 @@ class MainWindow(QMainWindow):
     
     def connect_signals(self):
         self.timer.state_changed.connect(self.on_state_changed)
-        self.timer.time_changed.connect(self.on_time_changed)
+        # display_changed is only connected while the window is shown
         self.timer.session_completed.connect(self.on_session_completed)
     
     def start_clicked(self):
@@ -111,9 +115,18 @@ class MainWindow(QMainWindow):
     
     def show_configuration(self):
         from .settings import ConfigurationDialog
-        dialog = ConfigurationDialog(self.config, self)
-        if dialog.exec():
+        if ConfigurationDialog.get_or_create(self.config, self).exec():
             self.auto_restart_checkbox.setChecked(self.config.auto_start_work_after_break)
+            if self.timer.current_state == TimerState.IDLE:
+                self.time_label.setText(self._idle_display())
+    
+    def _idle_display(self) -> str:
+        """Idle "MM:SS" text, rebuilt only when the work duration changes"""
+        seconds = self.config.work_duration_seconds
+        if seconds != self._idle_seconds:
+            self._idle_seconds = seconds
+            self._idle_text = format_time(seconds)
+        return self._idle_text
     
     def toggle_auto_restart(self, checked):
         self.config.update_setting('auto_start_work_after_break', checked)
@@ -123,10 +136,6 @@ class MainWindow(QMainWindow):
     def on_state_changed(self, state: TimerState):
         self.update_display()
     
-    @pyqtSlot(int)
-    def on_time_changed(self, remaining_seconds: int):
-        self.time_label.setText(self.timer.get_time_display())
-    
     @pyqtSlot(TimerState)
     def on_session_completed(self, completed_state: TimerState):
         if completed_state == TimerState.WORK:
@@ -145,10 +154,7 @@ class MainWindow(QMainWindow):
         
         if state == TimerState.IDLE:
             self.state_label.setText("Ready to start")
-            work_duration = self.config.work_duration_seconds
-            minutes = work_duration // 60
-            seconds = work_duration % 60
-            self.time_label.setText(f"{minutes:02d}:{seconds:02d}")
+            self.time_label.setText(self._idle_display())
         elif state == TimerState.WORK:
             self.state_label.setText("Work Session")
         elif state == TimerState.SHORT_BREAK:
@@ -161,7 +167,22 @@ class MainWindow(QMainWindow):
     def set_tray_available(self, available: bool):
         self.tray_available = available
     
+    def showEvent(self, event: QShowEvent):
+        if not self._ticks_connected:
+            if self.timer.current_state != TimerState.IDLE:
+                self.time_label.setText(self.timer.get_time_display())
+            self.timer.display_changed.connect(self.time_label.setText)
+            self._ticks_connected = True
+        super().showEvent(event)
+    
+    def hideEvent(self, event: QHideEvent):
+        if self._ticks_connected:
+            self.timer.display_changed.disconnect(self.time_label.setText)
+            self._ticks_connected = False
+        super().hideEvent(event)
+    
     def closeEvent(self, event: QCloseEvent):
+        self.config.flush()
         if self.tray_available:
             event.ignore()
             self.hide()
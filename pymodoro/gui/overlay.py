@@ -1,16 +1,24 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout
+from typing import Optional
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QButtonGroup
 from PyQt6.QtCore import Qt, pyqtSlot, QTimer
 from PyQt6.QtGui import QFont, QPalette, QColor, QKeyEvent
 from ..timer.states import TimerState
 from ..timer.core import PomodoroTimer
+from ..timer.controller import TimerController
 from ..utils.logger import get_logger
 from .styles import ButtonStyles, Fonts
 
+# Button ids within the overlay's QButtonGroup
+_SKIP_BUTTON, _EXTEND_BUTTON, _PAUSE_BUTTON = range(3)
+
 class BreakOverlay(QWidget):
-    def __init__(self, timer: PomodoroTimer):
+    def __init__(self, timer: PomodoroTimer, timer_controller: TimerController):
         super().__init__()
         self.timer = timer
+        self.timer_controller = timer_controller
         self.logger = get_logger()
+        self._last_rendered_state: Optional[TimerState] = None
+        self._ticks_connected = False
         self.setup_ui()
         self.connect_signals()
         
@@ -30,6 +38,8 @@ class BreakOverlay(QWidget):
             }
             QLabel, QPushButton {
                 background-color: transparent;
+            }
+            QLabel#timeLabel, QPushButton {
                 color: white;
             }
         """)
@@ -46,7 +56,15 @@ class BreakOverlay(QWidget):
         self.break_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.break_title)
         
+        # The title color is swapped via palette, so it must not be set by the stylesheet
+        self._title_palettes = {
+            TimerState.SHORT_BREAK: self._title_palette(42, 161, 152),
+            TimerState.LONG_BREAK: self._title_palette(38, 139, 210),
+            TimerState.PAUSED: self._title_palette(181, 137, 0),
+        }
+        
         self.time_label = QLabel("05:00")
+        self.time_label.setObjectName("timeLabel")
         time_font = QFont()
         time_font.setPointSize(Fonts.TIMER_LARGE)
         time_font.setBold(True)
@@ -68,25 +86,30 @@ class BreakOverlay(QWidget):
         button_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         button_layout.setSpacing(20)
         
+        button_font = QFont("", Fonts.BUTTON)
+        self._button_group = QButtonGroup(self)
+        self._button_group.setExclusive(False)
+        self._button_group.idClicked.connect(self._on_button_clicked)
+        
         self.skip_button = QPushButton("Skip Break")
-        self.skip_button.setFont(QFont("", Fonts.BUTTON))
+        self.skip_button.setFont(button_font)
         self.skip_button.setStyleSheet(ButtonStyles.skip_button_style())
         self.skip_button.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self.skip_button.clicked.connect(self.skip_break)
+        self._button_group.addButton(self.skip_button, _SKIP_BUTTON)
         button_layout.addWidget(self.skip_button)
         
         self.extend_button = QPushButton("Extend Break")
-        self.extend_button.setFont(QFont("", Fonts.BUTTON))
+        self.extend_button.setFont(button_font)
         self.extend_button.setStyleSheet(ButtonStyles.extend_button_style())
         self.extend_button.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self.extend_button.clicked.connect(self.extend_break)
+        self._button_group.addButton(self.extend_button, _EXTEND_BUTTON)
         button_layout.addWidget(self.extend_button)
         
         self.pause_button = QPushButton("Pause")
-        self.pause_button.setFont(QFont("", Fonts.BUTTON))
+        self.pause_button.setFont(button_font)
         self.pause_button.setStyleSheet(ButtonStyles.pause_button_style())
         self.pause_button.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self.pause_button.clicked.connect(self.pause_break)
+        self._button_group.addButton(self.pause_button, _PAUSE_BUTTON)
         button_layout.addWidget(self.pause_button)
         
         layout.addLayout(button_layout)
@@ -101,13 +124,21 @@ class BreakOverlay(QWidget):
         self.dismiss_label.setStyleSheet("color: rgba(255, 255, 255, 120);")
         layout.addWidget(self.dismiss_label)
     
+    def _title_palette(self, r: int, g: int, b: int) -> QPalette:
+        palette = QPalette(self.break_title.palette())
+        palette.setColor(QPalette.ColorRole.WindowText, QColor(r, g, b))
+        return palette
+    
     def connect_signals(self):
+        # display_changed is only connected while the overlay is shown
         self.timer.state_changed.connect(self.on_state_changed)
-        self.timer.time_changed.connect(self.on_time_changed)
     
     def show_overlay(self):
         screens = self.screen().availableGeometry()
         self.setGeometry(screens)
+        if not self._ticks_connected:
+            self.timer.display_changed.connect(self.time_label.setText)
+            self._ticks_connected = True
         self.update_display()
         self.show()
         self.raise_()
@@ -118,37 +149,59 @@ class BreakOverlay(QWidget):
     
     def hide_overlay(self):
         self.logger.debug("Break overlay hidden")
+        self._last_rendered_state = None
+        if self._ticks_connected:
+            self.timer.display_changed.disconnect(self.time_label.setText)
+            self._ticks_connected = False
         self.hide()
     
     def update_display(self):
-        state = self.timer.current_state
-        time_display = self.timer.get_time_display()
+        if self._update_static_labels(self.timer.current_state):
+            self._update_time_only()
+    
+    def _update_static_labels(self, state: TimerState) -> bool:
+        """Update title, message and pause button; these only change with the state"""
+        if state == self._last_rendered_state:
+            return True
         
         if state == TimerState.SHORT_BREAK:
             self.break_title.setText("Short Break")
-            self.break_title.setStyleSheet("color: rgba(42, 161, 152, 255);")
+            self.break_title.setPalette(self._title_palettes[state])
             self.message_label.setText("Take a quick breather")
         elif state == TimerState.LONG_BREAK:
             self.break_title.setText("Long Break")
-            self.break_title.setStyleSheet("color: rgba(38, 139, 210, 255);")
+            self.break_title.setPalette(self._title_palettes[state])
             self.message_label.setText("Time for a longer rest")
         elif state == TimerState.PAUSED:
             if self.timer.previous_state == TimerState.SHORT_BREAK:
                 self.break_title.setText("Short Break - Paused")
-                self.break_title.setStyleSheet("color: rgba(181, 137, 0, 255);")
+                self.break_title.setPalette(self._title_palettes[state])
             elif self.timer.previous_state == TimerState.LONG_BREAK:
                 self.break_title.setText("Long Break - Paused")
-                self.break_title.setStyleSheet("color: rgba(181, 137, 0, 255);")
+                self.break_title.setPalette(self._title_palettes[state])
             self.message_label.setText("Break paused")
             self.pause_button.setText("Resume")
         else:
             self.hide_overlay()
-            return
-        
-        self.time_label.setText(time_display)
+            return False
         
         if state != TimerState.PAUSED:
             self.pause_button.setText("Pause")
+        
+        self._last_rendered_state = state
+        return True
+    
+    def _update_time_only(self):
+        self.time_label.setText(self.timer.get_time_display())
+    
+    @pyqtSlot(int)
+    def _on_button_clicked(self, button_id: int):
+        if button_id == _SKIP_BUTTON:
+            self.skip_break()
+        elif button_id == _EXTEND_BUTTON:
+            self.extend_break()
+        elif button_id == _PAUSE_BUTTON:
+            self.pause_break()
     
     def skip_break(self):
         self.logger.info("Break skipped by user")
@@ -157,9 +210,8 @@ class BreakOverlay(QWidget):
     
     def extend_break(self):
         extension_seconds = 300
-        self.timer.remaining_seconds += extension_seconds
+        self.timer.extend(extension_seconds)
         self.logger.info(f"Break extended by {extension_seconds // 60} minutes")
-        self.timer.time_changed.emit(self.timer.remaining_seconds)
     
     def pause_break(self):
         if self.timer.current_state == TimerState.PAUSED:
@@ -167,9 +219,7 @@ class BreakOverlay(QWidget):
         else:
             self.logger.info("Break paused by user")
         
-        from ..timer.controller import TimerController
-        controller = TimerController(self.timer)
-        controller.pause_or_resume()
+        self.timer_controller.pause_or_resume()
     
     def keyPressEvent(self, event: QKeyEvent):
         if event.key() == Qt.Key.Key_Escape:
@@ -188,11 +238,7 @@ class BreakOverlay(QWidget):
         if state in [TimerState.SHORT_BREAK, TimerState.LONG_BREAK]:
             self.show_overlay()
         elif state == TimerState.PAUSED and self.timer.previous_state in [TimerState.SHORT_BREAK, TimerState.LONG_BREAK]:
-            self.update_display()
+            if self.isVisible():
+                self.update_display()
         else:
-            self.hide_overlay()
-    
-    @pyqtSlot(int)
-    def on_time_changed(self, remaining_seconds: int):
-        if self.isVisible():
-            self.update_display() 
\ No newline at end of file
+            self.hide_overlay() 
\ No newline at end of file
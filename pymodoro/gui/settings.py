@@ -1,19 +1,53 @@
 import os
-from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
+from functools import partial
+from typing import Optional
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout,
                              QLabel, QSpinBox, QPushButton, QCheckBox, QGroupBox,
                              QDialogButtonBox, QTabWidget, QWidget, QLineEdit,
-                             QSlider, QComboBox, QFileDialog)
-from PyQt6.QtCore import Qt
+                             QSlider, QComboBox, QFileDialog, QMessageBox)
+from PyQt6.QtCore import Qt, QTimer, QSignalBlocker
 from PyQt6.QtGui import QFont
+from ..config.models import PomodoroConfig
 from ..utils.logger import get_logger
-from ..audio.manager import SoundEvent
+from ..audio.manager import AudioManager, SoundEvent, SoundType
+
+_CACHED_DIALOG: Optional['ConfigurationDialog'] = None
+
+# Sound tab rows: event, row label and the config attribute holding its custom file
+_SOUND_EVENTS = (
+    (SoundEvent.WORK_START, "Work starts:", "work_start_sound"),
+    (SoundEvent.BREAK_START, "Break starts:", "break_start_sound"),
+    (SoundEvent.SESSION_COMPLETE, "Session complete:", "session_complete_sound"),
+    (SoundEvent.TIMER_FINISH, "Timer finish:", "timer_finish_sound"),
+)
+_EVENT_TO_ATTR = {event: config_attr for event, _, config_attr in _SOUND_EVENTS}
+# Volume label text for every slider position (0-100)
+_PCT_STRINGS = tuple(f"{i}%" for i in range(101))
 
 class ConfigurationDialog(QDialog):
+    # Shared by every Test click so the sound backend is only set up once
+    _audio_manager: Optional[AudioManager] = None
+    
     def __init__(self, config, parent=None):
         super().__init__(parent)
         self.config = config
         self.logger = get_logger()
+        self._file_dialog: Optional[QFileDialog] = None
         self.setup_ui()
+    
+    @classmethod
+    def get_or_create(cls, config, parent=None) -> 'ConfigurationDialog':
+        """Return the shared dialog, building it on first use and refreshing it afterwards"""
+        global _CACHED_DIALOG
+        if _CACHED_DIALOG is None:
+            _CACHED_DIALOG = cls(config, parent)
+        else:
+            _CACHED_DIALOG.reload_from(config)
+        return _CACHED_DIALOG
+    
+    def reload_from(self, config):
+        """Refresh the fields of a reused dialog from the current config"""
+        self.config = config
         self.load_settings()
     
     def setup_ui(self):
@@ -23,53 +57,74 @@ class ConfigurationDialog(QDialog):
         
         layout = QVBoxLayout(self)
         
-        # Create tab widget
-        tabs = QTabWidget()
+        # Create tab widget; only the Timer tab is built up front, the others
+        # are filled in the first time they are shown
+        self.tabs = QTabWidget()
+        self._tab_parts = (
+            ("Timer", self._build_timer_tab, self._load_timer_settings, self._save_timer_settings),
+            ("Misc", self._build_misc_tab, self._load_misc_settings, self._save_misc_settings),
+            ("Sounds", self._build_sound_tab, self._load_sound_settings, self._save_sound_settings),
+        )
+        self._built_tabs = set()
+        for label, _, _, _ in self._tab_parts:
+            self.tabs.addTab(QWidget(), label)
+        self._ensure_tab_built(0)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+        
+        layout.addWidget(self.tabs)
         
-        # Timer settings tab
-        timer_tab = QWidget()
+        # Button box
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | 
+            QDialogButtonBox.StandardButton.Cancel |
+            QDialogButtonBox.StandardButton.RestoreDefaults
+        )
+        button_box.accepted.connect(self.save_and_accept)
+        button_box.rejected.connect(self.reject)
+        button_box.button(QDialogButtonBox.StandardButton.RestoreDefaults).clicked.connect(self.restore_defaults)
+        
+        layout.addWidget(button_box)
+    
+    def _ensure_tab_built(self, index: int):
+        """Build a tab's widgets and load its settings on first use"""
+        if index in self._built_tabs or not 0 <= index < len(self._tab_parts):
+            return
+        _, build, load, _ = self._tab_parts[index]
+        build(self.tabs.widget(index))
+        self._built_tabs.add(index)
+        load()
+    
+    @staticmethod
+    def _make_spin(lo: int, hi: int, suffix: str = "") -> QSpinBox:
+        """Create a spin box with the given range and optional suffix"""
+        spin = QSpinBox()
+        spin.setRange(lo, hi)
+        if suffix:
+            spin.setSuffix(suffix)
+        return spin
+    
+    def _build_timer_tab(self, timer_tab: QWidget):
         timer_layout = QVBoxLayout(timer_tab)
         
         # Timer durations group
         durations_group = QGroupBox("Timer Durations")
-        durations_layout = QGridLayout(durations_group)
-        
-        # Work duration
-        durations_layout.addWidget(QLabel("Work Duration:"), 0, 0)
-        self.work_duration_spin = QSpinBox()
-        self.work_duration_spin.setRange(1, 120)
-        self.work_duration_spin.setSuffix(" min")
-        durations_layout.addWidget(self.work_duration_spin, 0, 1)
-        
-        # Short break duration
-        durations_layout.addWidget(QLabel("Short Break:"), 1, 0)
-        self.short_break_spin = QSpinBox()
-        self.short_break_spin.setRange(1, 60)
-        self.short_break_spin.setSuffix(" min")
-        durations_layout.addWidget(self.short_break_spin, 1, 1)
-        
-        # Long break duration
-        durations_layout.addWidget(QLabel("Long Break:"), 2, 0)
-        self.long_break_spin = QSpinBox()
-        self.long_break_spin.setRange(5, 120)
-        self.long_break_spin.setSuffix(" min")
-        durations_layout.addWidget(self.long_break_spin, 2, 1)
-        
-        # Sessions until long break
-        durations_layout.addWidget(QLabel("Sessions until Long Break:"), 3, 0)
-        self.sessions_spin = QSpinBox()
-        self.sessions_spin.setRange(2, 10)
-        durations_layout.addWidget(self.sessions_spin, 3, 1)
+        durations_layout = QFormLayout(durations_group)
+        
+        self.work_duration_spin = self._make_spin(1, 120, " min")
+        durations_layout.addRow("Work Duration:", self.work_duration_spin)
+        self.short_break_spin = self._make_spin(1, 60, " min")
+        durations_layout.addRow("Short Break:", self.short_break_spin)
+        self.long_break_spin = self._make_spin(5, 120, " min")
+        durations_layout.addRow("Long Break:", self.long_break_spin)
+        self.sessions_spin = self._make_spin(2, 10)
+        durations_layout.addRow("Sessions until Long Break:", self.sessions_spin)
         
         timer_layout.addWidget(durations_group)
         
 
         timer_layout.addStretch()
-        
-        tabs.addTab(timer_tab, "Timer")
-        
-        # Notifications tab
-        notifications_tab = QWidget()
+    
+    def _build_misc_tab(self, notifications_tab: QWidget):
         notifications_layout = QVBoxLayout(notifications_tab)
         
         # Notifications group
@@ -110,11 +165,8 @@ class ConfigurationDialog(QDialog):
         
 
         notifications_layout.addStretch()
-        
-        tabs.addTab(notifications_tab, "Misc")
-        
-        # Sound settings tab
-        sound_tab = QWidget()
+    
+    def _build_sound_tab(self, sound_tab: QWidget):
         sound_layout = QVBoxLayout(sound_tab)
         
         # Main sound controls
@@ -139,6 +191,12 @@ class ConfigurationDialog(QDialog):
         volume_layout.addWidget(self.volume_label)
         
         main_sound_layout.addLayout(volume_layout)
+        
+        # Coalesces slider drags into at most one label update per frame
+        self._volume_label_timer = QTimer(self)
+        self._volume_label_timer.setSingleShot(True)
+        self._volume_label_timer.setInterval(16)
+        self._volume_label_timer.timeout.connect(self._refresh_volume_label)
         sound_layout.addWidget(main_sound_group)
         
         # Sound type selection
@@ -154,157 +212,118 @@ class ConfigurationDialog(QDialog):
         # Sound events configuration
         events_group = QGroupBox("Sound Events")
         events_layout = QGridLayout(events_group)
+        events_group.setStyleSheet("QLabel#soundFileLabel { color: gray; }")
+        italic_font = QFont()
+        italic_font.setItalic(True)
         
         # Headers
         events_layout.addWidget(QLabel("Event"), 0, 0)
         events_layout.addWidget(QLabel("Sound File"), 0, 1)
         events_layout.addWidget(QLabel("Actions"), 0, 2)
         
-        # Work start
-        events_layout.addWidget(QLabel("Work starts:"), 1, 0)
-        self.work_sound_label = QLabel("Built-in chime")
-        self.work_sound_label.setStyleSheet("color: gray; font-style: italic;")
-        events_layout.addWidget(self.work_sound_label, 1, 1)
-        
-        work_actions = QHBoxLayout()
-        self.work_browse_btn = QPushButton("Browse...")
-        self.work_browse_btn.clicked.connect(lambda: self.browse_sound_file(SoundEvent.WORK_START))
-        self.work_test_btn = QPushButton("Test")
-        self.work_test_btn.clicked.connect(lambda: self.test_sound(SoundEvent.WORK_START))
-        work_actions.addWidget(self.work_browse_btn)
-        work_actions.addWidget(self.work_test_btn)
-        work_widget = QWidget()
-        work_widget.setLayout(work_actions)
-        events_layout.addWidget(work_widget, 1, 2)
-        
-        # Break start
-        events_layout.addWidget(QLabel("Break starts:"), 2, 0)
-        self.break_sound_label = QLabel("Built-in chime")
-        self.break_sound_label.setStyleSheet("color: gray; font-style: italic;")
-        events_layout.addWidget(self.break_sound_label, 2, 1)
-        
-        break_actions = QHBoxLayout()
-        self.break_browse_btn = QPushButton("Browse...")
-        self.break_browse_btn.clicked.connect(lambda: self.browse_sound_file(SoundEvent.BREAK_START))
-        self.break_test_btn = QPushButton("Test")
-        self.break_test_btn.clicked.connect(lambda: self.test_sound(SoundEvent.BREAK_START))
-        break_actions.addWidget(self.break_browse_btn)
-        break_actions.addWidget(self.break_test_btn)
-        break_widget = QWidget()
-        break_widget.setLayout(break_actions)
-        events_layout.addWidget(break_widget, 2, 2)
-        
-        # Session complete
-        events_layout.addWidget(QLabel("Session complete:"), 3, 0)
-        self.session_sound_label = QLabel("Built-in chime")
-        self.session_sound_label.setStyleSheet("color: gray; font-style: italic;")
-        events_layout.addWidget(self.session_sound_label, 3, 1)
-        
-        session_actions = QHBoxLayout()
-        self.session_browse_btn = QPushButton("Browse...")
-        self.session_browse_btn.clicked.connect(lambda: self.browse_sound_file(SoundEvent.SESSION_COMPLETE))
-        self.session_test_btn = QPushButton("Test")
-        self.session_test_btn.clicked.connect(lambda: self.test_sound(SoundEvent.SESSION_COMPLETE))
-        session_actions.addWidget(self.session_browse_btn)
-        session_actions.addWidget(self.session_test_btn)
-        session_widget = QWidget()
-        session_widget.setLayout(session_actions)
-        events_layout.addWidget(session_widget, 3, 2)
-        
-        # Timer finish
-        events_layout.addWidget(QLabel("Timer finish:"), 4, 0)
-        self.finish_sound_label = QLabel("Built-in chime")
-        self.finish_sound_label.setStyleSheet("color: gray; font-style: italic;")
-        events_layout.addWidget(self.finish_sound_label, 4, 1)
-        
-        finish_actions = QHBoxLayout()
-        self.finish_browse_btn = QPushButton("Browse...")
-        self.finish_browse_btn.clicked.connect(lambda: self.browse_sound_file(SoundEvent.TIMER_FINISH))
-        self.finish_test_btn = QPushButton("Test")
-        self.finish_test_btn.clicked.connect(lambda: self.test_sound(SoundEvent.TIMER_FINISH))
-        finish_actions.addWidget(self.finish_browse_btn)
-        finish_actions.addWidget(self.finish_test_btn)
-        finish_widget = QWidget()
-        finish_widget.setLayout(finish_actions)
-        events_layout.addWidget(finish_widget, 4, 2)
+        self._sound_rows = {}
+        for row, (event, title, _) in enumerate(_SOUND_EVENTS, start=1):
+            events_layout.addWidget(QLabel(title), row, 0)
+            sound_label = QLabel("Built-in chime")
+            sound_label.setObjectName("soundFileLabel")
+            sound_label.setFont(italic_font)
+            events_layout.addWidget(sound_label, row, 1)
+            
+            actions = QHBoxLayout()
+            browse_btn = QPushButton("Browse...")
+            browse_btn.clicked.connect(partial(self.browse_sound_file, event))
+            test_btn = QPushButton("Test")
+            test_btn.clicked.connect(partial(self.test_sound, event))
+            actions.addWidget(browse_btn)
+            actions.addWidget(test_btn)
+            events_layout.addLayout(actions, row, 2)
+            
+            self._sound_rows[event] = (sound_label, browse_btn, test_btn)
         
         sound_layout.addWidget(events_group)
         sound_layout.addStretch()
         
-        tabs.addTab(sound_tab, "Sounds")
-        
-        layout.addWidget(tabs)
-        
-        # Button box
-        button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | 
-            QDialogButtonBox.StandardButton.Cancel |
-            QDialogButtonBox.StandardButton.RestoreDefaults
-        )
-        button_box.accepted.connect(self.save_and_accept)
-        button_box.rejected.connect(self.reject)
-        button_box.button(QDialogButtonBox.StandardButton.RestoreDefaults).clicked.connect(self.restore_defaults)
-        
-        layout.addWidget(button_box)
+        # Connect sound settings signals
+        self.volume_slider.valueChanged.connect(self._on_volume_changed)
+        self.enable_sounds_cb.toggled.connect(self._on_sounds_toggled)
+        self.sound_type_combo.currentTextChanged.connect(self._on_sound_type_changed)
     
     def load_settings(self):
-        # Load current settings into the UI
+        # Load current settings into the tabs built so far
+        for index in sorted(self._built_tabs):
+            self._tab_parts[index][2]()
+    
+    def _load_timer_settings(self):
         self.work_duration_spin.setValue(self.config.work_duration)
         self.short_break_spin.setValue(self.config.short_break_duration)
         self.long_break_spin.setValue(self.config.long_break_duration)
         self.sessions_spin.setValue(self.config.sessions_until_long_break)
-        
+    
+    def _load_misc_settings(self):
         self.auto_restart_cb.setChecked(self.config.auto_start_work_after_break)
         
         self.hotkey_enabled_cb.setChecked(self.config.enable_global_hotkey)
         self.hotkey_input.setText(self.config.global_hotkey)
-        
-        # Load sound settings
-        self.enable_sounds_cb.setChecked(self.config.enable_sounds)
-        self.volume_slider.setValue(int(self.config.sound_volume * 100))
-        self._update_volume_label(int(self.config.sound_volume * 100))
-        
-        # Set sound type combo
+    
+    def _load_sound_settings(self):
+        self._apply_sound_settings(self.config.enable_sounds, self.config.sound_volume,
+                                   self.config.sound_type)
+    
+    def _apply_sound_settings(self, enabled: bool, volume: float, sound_type: str):
+        """Set the sound widgets with their handlers blocked, then sync dependent widgets once shown"""
+        volume_percent = int(volume * 100)
         sound_type_map = {"chimes": 0, "custom": 1}
-        self.sound_type_combo.setCurrentIndex(sound_type_map.get(self.config.sound_type, 0))
-        
-        # Load custom sound file paths
-        self._update_sound_labels()
-        
-        # Connect sound settings signals
-        self.volume_slider.valueChanged.connect(self._update_volume_label)
-        self.enable_sounds_cb.toggled.connect(self._on_sounds_toggled)
-        self.sound_type_combo.currentTextChanged.connect(self._on_sound_type_changed)
+        with QSignalBlocker(self.enable_sounds_cb), QSignalBlocker(self.volume_slider), \
+                QSignalBlocker(self.sound_type_combo):
+            self.enable_sounds_cb.setChecked(enabled)
+            self.volume_slider.setValue(volume_percent)
+            self.sound_type_combo.setCurrentIndex(sound_type_map.get(sound_type, 0))
+        
+        self._update_volume_label(volume_percent)
+        # Let the tab paint first; the enable/disable cascade runs right after
+        QTimer.singleShot(0, self._finalize_sound_state)
+    
+    def _finalize_sound_state(self):
+        """Sync button enabled states and file labels with the loaded sound widgets"""
+        self._on_sounds_toggled(self.enable_sounds_cb.isChecked())
+        # Also refreshes the custom sound file labels
+        self._on_sound_type_changed(self.sound_type_combo.currentText())
     
     def save_and_accept(self):
-        # Save settings to config
-        self.config.work_duration = self.work_duration_spin.value()
-        self.config.short_break_duration = self.short_break_spin.value()
-        self.config.long_break_duration = self.long_break_spin.value()
-        self.config.sessions_until_long_break = self.sessions_spin.value()
+        # Save settings to config; tabs never built still hold the config values
+        for index in sorted(self._built_tabs):
+            self._tab_parts[index][3]()
         
-        self.config.auto_start_work_after_break = self.auto_restart_cb.isChecked()
+        # Save to file through the manager that loaded the config
+        self.config.flush()
         
-        self.config.enable_global_hotkey = self.hotkey_enabled_cb.isChecked()
-        self.config.global_hotkey = self.hotkey_input.text().strip()
+        self.logger.info("Configuration saved")
+        self.accept()
+    
+    def _save_timer_settings(self):
+        self.config.update_setting('work_duration', self.work_duration_spin.value())
+        self.config.update_setting('short_break_duration', self.short_break_spin.value())
+        self.config.update_setting('long_break_duration', self.long_break_spin.value())
+        self.config.update_setting('sessions_until_long_break', self.sessions_spin.value())
+    
+    def _save_misc_settings(self):
+        self.config.update_setting('auto_start_work_after_break', self.auto_restart_cb.isChecked())
         
-        # Save sound settings
-        self.config.enable_sounds = self.enable_sounds_cb.isChecked()
-        self.config.sound_volume = self.volume_slider.value() / 100.0
+        self.config.update_setting('enable_global_hotkey', self.hotkey_enabled_cb.isChecked())
+        self.config.update_setting('global_hotkey', self.hotkey_input.text().strip())
+    
+    def _save_sound_settings(self):
+        self.config.update_setting('enable_sounds', self.enable_sounds_cb.isChecked())
+        self.config.update_setting('sound_volume', self.volume_slider.value() / 100.0)
         
         sound_type_map = {0: "chimes", 1: "custom"}
-        self.config.sound_type = sound_type_map.get(self.sound_type_combo.currentIndex(), "chimes")
-        
-        # Save to file
-        from ..config.manager import ConfigManager
-        config_manager = ConfigManager()
-        config_manager.save_config()
-        
-        self.logger.info("Configuration saved")
-        self.accept()
+        self.config.update_setting('sound_type', sound_type_map.get(self.sound_type_combo.currentIndex(), "chimes"))
     
     def restore_defaults(self):
-        from ..config.models import PomodoroConfig
+        # Defaults are applied to the widgets, so every tab has to exist
+        for index in range(len(self._tab_parts)):
+            self._ensure_tab_built(index)
+        
         defaults = PomodoroConfig()
         
         self.work_duration_spin.setValue(defaults.work_duration)
@@ -317,20 +336,11 @@ class ConfigurationDialog(QDialog):
         self.hotkey_enabled_cb.setChecked(defaults.enable_global_hotkey)
         self.hotkey_input.setText(defaults.global_hotkey)
         
-        # Restore sound defaults
-        self.enable_sounds_cb.setChecked(defaults.enable_sounds)
-        self.volume_slider.setValue(int(defaults.sound_volume * 100))
-        self._update_volume_label(int(defaults.sound_volume * 100))
-        
-        sound_type_map = {"chimes": 0, "custom": 1}
-        self.sound_type_combo.setCurrentIndex(sound_type_map.get(defaults.sound_type, 0))
-        
-        # Clear custom sound paths
-        self.config.work_start_sound = ""
-        self.config.break_start_sound = ""
-        self.config.session_complete_sound = ""
-        self.config.timer_finish_sound = ""
-        self._update_sound_labels()
+        # Clear custom sound paths, then restore sound defaults
+        for config_attr in _EVENT_TO_ATTR.values():
+            setattr(self.config, config_attr, "")
+        self._apply_sound_settings(defaults.enable_sounds, defaults.sound_volume,
+                                   defaults.sound_type)
     
     def test_hotkey(self):
         hotkey_str = self.hotkey_input.text().strip()
@@ -345,15 +355,22 @@ class ConfigurationDialog(QDialog):
             self.show_message(f"✗ Invalid hotkey format: {hotkey_str}\nExample: ctrl+alt+p")
     
     def show_message(self, message):
-        from PyQt6.QtWidgets import QMessageBox
         msg = QMessageBox(self)
         msg.setWindowTitle("Hotkey Test")
         msg.setText(message)
         msg.exec()
     
+    def _on_volume_changed(self, value):
+        """Throttle volume label updates while the slider is dragged"""
+        if not self._volume_label_timer.isActive():
+            self._volume_label_timer.start()
+    
+    def _refresh_volume_label(self):
+        self._update_volume_label(self.volume_slider.value())
+    
     def _update_volume_label(self, value):
         """Update volume percentage label"""
-        self.volume_label.setText(f"{value}%")
+        self.volume_label.setText(_PCT_STRINGS[value])
     
     def _on_sounds_toggled(self, enabled):
         """Handle sound enable/disable"""
@@ -361,24 +378,18 @@ class ConfigurationDialog(QDialog):
         self.sound_type_combo.setEnabled(enabled)
         
         # Enable/disable all sound controls
-        self.work_browse_btn.setEnabled(enabled)
-        self.work_test_btn.setEnabled(enabled)
-        self.break_browse_btn.setEnabled(enabled)
-        self.break_test_btn.setEnabled(enabled)
-        self.session_browse_btn.setEnabled(enabled)
-        self.session_test_btn.setEnabled(enabled)
-        self.finish_browse_btn.setEnabled(enabled)
-        self.finish_test_btn.setEnabled(enabled)
+        for _, browse_btn, test_btn in self._sound_rows.values():
+            browse_btn.setEnabled(enabled)
+            test_btn.setEnabled(enabled)
     
     def _on_sound_type_changed(self, text):
         """Handle sound type change"""
         is_custom = text == "Custom sounds"
         
         # Enable/disable browse buttons based on sound type
-        self.work_browse_btn.setEnabled(is_custom and self.enable_sounds_cb.isChecked())
-        self.break_browse_btn.setEnabled(is_custom and self.enable_sounds_cb.isChecked())
-        self.session_browse_btn.setEnabled(is_custom and self.enable_sounds_cb.isChecked())
-        self.finish_browse_btn.setEnabled(is_custom and self.enable_sounds_cb.isChecked())
+        browse_enabled = is_custom and self.enable_sounds_cb.isChecked()
+        for _, browse_btn, _ in self._sound_rows.values():
+            browse_btn.setEnabled(browse_enabled)
         
         self._update_sound_labels()
     
@@ -386,42 +397,31 @@ class ConfigurationDialog(QDialog):
         """Update sound file labels based on current settings"""
         is_custom = self.sound_type_combo.currentText() == "Custom sounds"
         
-        if is_custom:
-            self.work_sound_label.setText(self._get_sound_file_display(self.config.work_start_sound))
-            self.break_sound_label.setText(self._get_sound_file_display(self.config.break_start_sound))
-            self.session_sound_label.setText(self._get_sound_file_display(self.config.session_complete_sound))
-            self.finish_sound_label.setText(self._get_sound_file_display(self.config.timer_finish_sound))
-        else:
-            self.work_sound_label.setText("Built-in chime")
-            self.break_sound_label.setText("Built-in chime")
-            self.session_sound_label.setText("Built-in chime")
-            self.finish_sound_label.setText("Built-in chime")
+        for event, _, config_attr in _SOUND_EVENTS:
+            if is_custom:
+                text = self._get_sound_file_display(getattr(self.config, config_attr))
+            else:
+                text = "Built-in chime"
+            self._sound_rows[event][0].setText(text)
     
     def _get_sound_file_display(self, file_path: str) -> str:
         """Get display text for sound file path"""
-        if not file_path:
-            return "No file selected"
-        return os.path.basename(file_path)
+        return file_path.rsplit(os.sep, 1)[-1] if file_path else "No file selected"
     
     def browse_sound_file(self, event: SoundEvent):
         """Browse for custom sound file"""
-        file_dialog = QFileDialog(self)
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+            self._file_dialog.setNameFilter("Audio files (*.wav *.mp3 *.ogg *.flac);;All files (*)")
+            self._file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        file_dialog = self._file_dialog
         file_dialog.setWindowTitle(f"Select sound for {event.value.replace('_', ' ').title()}")
-        file_dialog.setNameFilter("Audio files (*.wav *.mp3 *.ogg *.flac);;All files (*)")
-        file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
         
         if file_dialog.exec() == QFileDialog.DialogCode.Accepted:
             selected_file = file_dialog.selectedFiles()[0]
             
             # Update config based on event type
-            if event == SoundEvent.WORK_START:
-                self.config.work_start_sound = selected_file
-            elif event == SoundEvent.BREAK_START:
-                self.config.break_start_sound = selected_file
-            elif event == SoundEvent.SESSION_COMPLETE:
-                self.config.session_complete_sound = selected_file
-            elif event == SoundEvent.TIMER_FINISH:
-                self.config.timer_finish_sound = selected_file
+            setattr(self.config, _EVENT_TO_ATTR[event], selected_file)
             
             self._update_sound_labels()
             self.logger.info(f"Selected sound file for {event.value}: {selected_file}")
@@ -429,8 +429,16 @@ class ConfigurationDialog(QDialog):
     def test_sound(self, event: SoundEvent):
         """Test play a sound event"""
         try:
-            from ..audio.manager import AudioManager
-            audio_manager = AudioManager()
+            cls = type(self)
+            if cls._audio_manager is None:
+                cls._audio_manager = AudioManager()
+            audio_manager = cls._audio_manager
+            
+            # Custom files may have changed since the last test, so re-read them
+            sound_type = SoundType.CHIMES if self.config.sound_type == "chimes" else SoundType.CUSTOM
+            if sound_type == SoundType.CUSTOM or audio_manager.sound_type != sound_type:
+                audio_manager.set_sound_type(sound_type)
+            
             audio_manager.set_enabled(True)
             audio_manager.set_volume(self.volume_slider.value() / 100.0)
             audio_manager.test_sound(event)
@@ -4,6 +4,7 @@ Eliminates duplicated styling code across GUI components
 """
 
 from PyQt6.QtGui import QColor
+from ..timer.states import TimerState
 
 class Colors:
     """Color constants used throughout the application"""
@@ -47,32 +48,37 @@ class ButtonStyles:
     @staticmethod
     def skip_button_style() -> str:
         """Red skip button style"""
-        return ButtonStyles.get_break_button_style(
-            "rgba(220, 50, 47, 180)",
-            "rgba(220, 50, 47, 255)", 
-            "rgba(220, 50, 47, 220)",
-            "rgba(180, 40, 37, 255)"
-        )
+        return _SKIP_STYLE
     
     @staticmethod
     def extend_button_style() -> str:
         """Blue extend button style"""
-        return ButtonStyles.get_break_button_style(
-            "rgba(38, 139, 210, 180)",
-            "rgba(38, 139, 210, 255)",
-            "rgba(38, 139, 210, 220)", 
-            "rgba(30, 110, 180, 255)"
-        )
+        return _EXTEND_STYLE
     
     @staticmethod
     def pause_button_style() -> str:
         """Yellow pause button style"""
-        return ButtonStyles.get_break_button_style(
-            "rgba(181, 137, 0, 180)",
-            "rgba(181, 137, 0, 255)",
-            "rgba(181, 137, 0, 220)",
-            "rgba(150, 110, 0, 255)"
-        )
+        return _PAUSE_STYLE
+
+# Break button styles are fixed, so format them once at import
+_SKIP_STYLE = ButtonStyles.get_break_button_style(
+    "rgba(220, 50, 47, 180)",
+    "rgba(220, 50, 47, 255)", 
+    "rgba(220, 50, 47, 220)",
+    "rgba(180, 40, 37, 255)"
+)
+_EXTEND_STYLE = ButtonStyles.get_break_button_style(
+    "rgba(38, 139, 210, 180)",
+    "rgba(38, 139, 210, 255)",
+    "rgba(38, 139, 210, 220)", 
+    "rgba(30, 110, 180, 255)"
+)
+_PAUSE_STYLE = ButtonStyles.get_break_button_style(
+    "rgba(181, 137, 0, 180)",
+    "rgba(181, 137, 0, 255)",
+    "rgba(181, 137, 0, 220)",
+    "rgba(150, 110, 0, 255)"
+)
 
 class StateColors:
     """Timer state color mappings"""
@@ -83,20 +89,18 @@ class StateColors:
     PAUSED = Colors.YELLOW
     IDLE = Colors.GRAY
     
-    @staticmethod
-    def get_color_for_state(state) -> QColor:
+    _COLOR_MAP = {
+        TimerState.WORK: WORK,
+        TimerState.SHORT_BREAK: SHORT_BREAK,
+        TimerState.LONG_BREAK: LONG_BREAK,
+        TimerState.PAUSED: PAUSED,
+        TimerState.IDLE: IDLE
+    }
+    
+    @classmethod
+    def get_color_for_state(cls, state) -> QColor:
         """Get color for timer state"""
-        from ..timer.states import TimerState
-        
-        color_map = {
-            TimerState.WORK: StateColors.WORK,
-            TimerState.SHORT_BREAK: StateColors.SHORT_BREAK,
-            TimerState.LONG_BREAK: StateColors.LONG_BREAK,
-            TimerState.PAUSED: StateColors.PAUSED,
-            TimerState.IDLE: StateColors.IDLE
-        }
-        
-        return color_map.get(state, StateColors.IDLE)
+        return cls._COLOR_MAP.get(state, cls.IDLE)
 
 class Fonts:
     """Font size constants"""
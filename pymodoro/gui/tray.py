@@ -1,6 +1,7 @@
+from functools import lru_cache
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QApplication
-from PyQt6.QtCore import QObject, pyqtSlot, QTimer
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QFont, QColor, QPen, QBrush
+from PyQt6.QtCore import Qt, QObject, pyqtSlot, QTimer
+from PyQt6.QtGui import QIcon, QImage, QPixmap, QPixmapCache, QPainter, QFont, QColor, QPen, QBrush
 from ..timer.states import TimerState
 from ..timer.core import PomodoroTimer
 from ..timer.controller import TimerController
@@ -8,6 +9,53 @@ from ..config.provider import ConfigProvider
 from ..utils.logger import get_logger
 from .styles import StateColors
 
+# The progress arc advances in this many steps per session
+_PROGRESS_STEPS = 60
+
+# Pixmap sizes added to every tray icon; icons are drawn at the largest
+_ICON_SIZES = (16, 22, 32, 64)
+
+# Icon drawing resources, built once
+_TRANSPARENT = QColor(0, 0, 0, 0)
+_TEXT_COLOR = QColor(255, 255, 255)
+_ARC_COLOR = QColor(46, 125, 50)
+_ARC_WIDTH = int(64 * 0.15)
+_ARC_PEN = QPen(_ARC_COLOR, _ARC_WIDTH)
+_ICON_FONT = QFont()
+_ICON_FONT.setPointSize(12)
+_ICON_FONT.setBold(True)
+
+# Icon color, config attribute holding the session length, and tooltip label per state
+_STATE_INFO = {
+    TimerState.WORK: (StateColors.WORK, 'work_duration_seconds', 'Work'),
+    TimerState.SHORT_BREAK: (StateColors.SHORT_BREAK, 'short_break_duration_seconds', 'Short Break'),
+    TimerState.LONG_BREAK: (StateColors.LONG_BREAK, 'long_break_duration_seconds', 'Long Break'),
+    TimerState.PAUSED: (StateColors.PAUSED, None, 'Paused'),
+}
+
+@lru_cache(maxsize=128)
+def get_rounded_minutes(remaining_seconds: int) -> str:
+    """Minutes left, rounded to the nearest minute, as shown on the icon"""
+    minutes = remaining_seconds // 60
+    seconds = remaining_seconds % 60
+    if seconds >= 30:
+        minutes += 1
+    return str(minutes)
+
+def get_progress(remaining_seconds: int, total_seconds: int) -> float:
+    """Elapsed fraction of the session"""
+    if total_seconds <= 0:
+        return 0.0
+    elapsed = total_seconds - remaining_seconds
+    return elapsed / total_seconds
+
+def _icon_from_pixmaps(pixmaps) -> QIcon:
+    """Combine pre-scaled pixmaps into one multi-size icon"""
+    icon = QIcon()
+    for pixmap in pixmaps:
+        icon.addPixmap(pixmap)
+    return icon
+
 class SystemTray(QObject):
     def __init__(self, timer: PomodoroTimer, timer_controller: TimerController, main_window):
         super().__init__()
@@ -16,6 +64,13 @@ class SystemTray(QObject):
         self.main_window = main_window
         self.config = ConfigProvider.get()
         self.logger = get_logger()
+        self._last_icon_key = None
+        self._last_tick_key = None
+        self._bg_templates = {}
+        self._arc_sprites = {}
+        self._repaint_pending = False
+        self._cache_durations()
+        self._tooltip_prefix = ""
         
         if not QSystemTrayIcon.isSystemTrayAvailable():
             raise Exception("System tray is not available")
@@ -73,99 +128,109 @@ class SystemTray(QObject):
         self.timer.state_changed.connect(self.on_state_changed)
         self.timer.time_changed.connect(self.on_time_changed)
     
-    def create_timer_icon(self, text: str, color: QColor, progress: float = 0.0) -> QIcon:
-        pixmap = QPixmap(64, 64)
-        pixmap.fill(QColor(0, 0, 0, 0))
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        painter.setBrush(color)
-        painter.setPen(color)
-        painter.drawEllipse(2, 2, 60, 60)
-        
-        if progress > 0.0:
-            painter.setPen(QColor(46, 125, 50))
-            painter.setBrush(QColor(0, 0, 0, 0))
+    def _background_template(self, color: QColor) -> QImage:
+        """Transparent image with the filled state circle, drawn once per color"""
+        template = self._bg_templates.get(color.rgb())
+        if template is None:
+            template = QImage(64, 64, QImage.Format.Format_ARGB32_Premultiplied)
+            template.fill(_TRANSPARENT)
+            painter = QPainter(template)
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setBrush(color)
+            painter.setPen(color)
+            painter.drawEllipse(2, 2, 60, 60)
+            painter.end()
+            self._bg_templates[color.rgb()] = template
+        return template
+    
+    def _arc_sprite(self, bucket: int) -> QImage:
+        """Transparent image with the progress arc for one progress step, drawn once"""
+        sprite = self._arc_sprites.get(bucket)
+        if sprite is None:
+            sprite = QImage(64, 64, QImage.Format.Format_ARGB32_Premultiplied)
+            sprite.fill(_TRANSPARENT)
+            painter = QPainter(sprite)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(_ARC_PEN)
+            painter.setBrush(_TRANSPARENT)
             
-            pen = painter.pen()
-            border_width = int(64 * 0.15)
-            pen.setWidth(border_width)
-            painter.setPen(pen)
-            
-            margin = border_width // 2
+            margin = _ARC_WIDTH // 2
             start_angle = 90 * 16
-            span_angle = int(-progress * 360 * 16)
+            span_angle = int(-bucket / _PROGRESS_STEPS * 360 * 16)
             painter.drawArc(margin, margin, 64 - 2*margin, 64 - 2*margin, start_angle, span_angle)
+            painter.end()
+            self._arc_sprites[bucket] = sprite
+        return sprite
+    
+    def _render_pixmaps(self, text: str, color: QColor, progress: float = 0.0) -> list:
+        """Draw the icon at 64 px and return it pre-scaled to every size in _ICON_SIZES"""
+        image = self._background_template(color).copy()
         
-        painter.setPen(QColor(255, 255, 255))
-        font = QFont()
-        font.setPointSize(12)
-        font.setBold(True)
-        painter.setFont(font)
+        painter = QPainter(image)
         
-        from PyQt6.QtCore import Qt
-        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
+        bucket = int(progress * _PROGRESS_STEPS)
+        if bucket > 0:
+            painter.drawImage(0, 0, self._arc_sprite(bucket))
+        
+        painter.setPen(_TEXT_COLOR)
+        painter.setFont(_ICON_FONT)
+        
+        painter.drawText(image.rect(), Qt.AlignmentFlag.AlignCenter, text)
         painter.end()
         
-        return QIcon(pixmap)
+        # Pre-scale to the usual tray sizes so the platform never rescales per paint
+        pixmaps = []
+        for size in _ICON_SIZES:
+            scaled = image if size == image.width() else image.scaled(
+                size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            pixmaps.append(QPixmap.fromImage(scaled))
+        return pixmaps
+    
+    def create_timer_icon(self, text: str, color: QColor, progress: float = 0.0) -> QIcon:
+        return _icon_from_pixmaps(self._render_pixmaps(text, color, progress))
+    
+    def _cached_icon(self, key: tuple, text: str, color: QColor, progress: float) -> QIcon:
+        """Build the icon from pixmaps kept in QPixmapCache, re-rendering once evicted"""
+        prefix = "pymodoro-tray:%s:%s:%x:%d:" % (key[0].value, key[1], key[2], key[3])
+        pixmaps = [QPixmapCache.find(prefix + str(size)) for size in _ICON_SIZES]
+        if any(pixmap is None for pixmap in pixmaps):
+            pixmaps = self._render_pixmaps(text, color, progress)
+            for size, pixmap in zip(_ICON_SIZES, pixmaps):
+                QPixmapCache.insert(prefix + str(size), pixmap)
+        return _icon_from_pixmaps(pixmaps)
     
     def update_icon(self):
         state = self.timer.current_state
-        time_text = self.timer.get_time_display()
-        
-        def get_rounded_minutes(remaining_seconds):
-            minutes = remaining_seconds // 60
-            seconds = remaining_seconds % 60
-            if seconds >= 30:
-                minutes += 1
-            return str(minutes)
-        
-        def get_progress(remaining_seconds, total_seconds):
-            if total_seconds <= 0:
-                return 0.0
-            elapsed = total_seconds - remaining_seconds
-            return elapsed / total_seconds
         
         if state == TimerState.IDLE:
-            icon = self.create_timer_icon("●", StateColors.IDLE)
+            text, color, progress = "●", StateColors.IDLE, 0.0
             tooltip = "Pymodoro - Ready"
-        elif state == TimerState.WORK:
-            total_seconds = self.config.work_duration_seconds
-            progress = get_progress(self.timer.remaining_seconds, total_seconds)
-            rounded_minutes = get_rounded_minutes(self.timer.remaining_seconds)
-            icon = self.create_timer_icon(rounded_minutes, StateColors.WORK, progress)
-            tooltip = f"Pymodoro - Work: {time_text}"
-        elif state == TimerState.SHORT_BREAK:
-            total_seconds = self.config.short_break_duration_seconds
-            progress = get_progress(self.timer.remaining_seconds, total_seconds)
-            rounded_minutes = get_rounded_minutes(self.timer.remaining_seconds)
-            icon = self.create_timer_icon(rounded_minutes, StateColors.SHORT_BREAK, progress)
-            tooltip = f"Pymodoro - Short Break: {time_text}"
-        elif state == TimerState.LONG_BREAK:
-            total_seconds = self.config.long_break_duration_seconds
-            progress = get_progress(self.timer.remaining_seconds, total_seconds)
-            rounded_minutes = get_rounded_minutes(self.timer.remaining_seconds)
-            icon = self.create_timer_icon(rounded_minutes, StateColors.LONG_BREAK, progress)
-            tooltip = f"Pymodoro - Long Break: {time_text}"
-        elif state == TimerState.PAUSED:
-            total_seconds = self.get_total_seconds_for_state(self.timer.previous_state)
-            progress = get_progress(self.timer.remaining_seconds, total_seconds) if total_seconds > 0 else 0.0
-            icon = self.create_timer_icon("||", StateColors.PAUSED, progress)
-            tooltip = f"Pymodoro - Paused: {time_text}"
-        
-        self.tray_icon.setIcon(icon)
+        else:
+            color, _, label = _STATE_INFO[state]
+            remaining = self.timer.remaining_seconds
+            if state == TimerState.PAUSED:
+                total_seconds = self.get_total_seconds_for_state(self.timer.previous_state)
+                text = "||"
+            else:
+                total_seconds = self.get_total_seconds_for_state(state)
+                text = get_rounded_minutes(remaining)
+            progress = get_progress(remaining, total_seconds)
+            self._tooltip_prefix = f"Pymodoro - {label}: "
+            tooltip = self._tooltip_prefix + self.timer.get_time_display()
+        
+        key = (state, text, color.rgb(), int(progress * _PROGRESS_STEPS))
+        if key != self._last_icon_key:
+            self._last_icon_key = key
+            self.tray_icon.setIcon(self._cached_icon(key, text, color, progress))
         self.tray_icon.setToolTip(tooltip)
     
+    def _cache_durations(self):
+        """Snapshot session lengths; refreshed on state changes and after configuration"""
+        self._durations = {state: getattr(self.config, attr)
+                           for state, (_, attr, _) in _STATE_INFO.items() if attr}
+    
     def get_total_seconds_for_state(self, state):
-        if state == TimerState.WORK:
-            return self.config.work_duration_seconds
-        elif state == TimerState.SHORT_BREAK:
-            return self.config.short_break_duration_seconds
-        elif state == TimerState.LONG_BREAK:
-            return self.config.long_break_duration_seconds
-        return 0
+        return self._durations.get(state, 0)
     
     def update_menu_state(self):
         start_enabled, start_text = self.timer_controller.get_start_button_state()
@@ -205,11 +270,31 @@ class SystemTray(QObject):
     
     @pyqtSlot(TimerState)
     def on_state_changed(self, state: TimerState):
-        self.update_icon()
+        self._cache_durations()
+        self._schedule_repaint()
         self.update_menu_state()
     
     @pyqtSlot(int)
     def on_time_changed(self, remaining_seconds: int):
+        state = self.timer.current_state
+        total_seconds = self.get_total_seconds_for_state(state)
+        tick_key = (get_rounded_minutes(remaining_seconds),
+                    int(get_progress(remaining_seconds, total_seconds) * _PROGRESS_STEPS), state)
+        if tick_key == self._last_tick_key:
+            # Icon is unchanged, only the MM:SS in the tooltip moves
+            self.tray_icon.setToolTip(self._tooltip_prefix + self.timer.get_time_display())
+            return
+        self._last_tick_key = tick_key
+        self._schedule_repaint()
+    
+    def _schedule_repaint(self):
+        """Coalesce icon updates requested within one event loop pass"""
+        if not self._repaint_pending:
+            self._repaint_pending = True
+            QTimer.singleShot(0, self._do_repaint)
+    
+    def _do_repaint(self):
+        self._repaint_pending = False
         self.update_icon()
     
     def toggle_auto_restart(self, checked):
@@ -218,6 +303,7 @@ class SystemTray(QObject):
     
     def show_configuration(self):
         from .settings import ConfigurationDialog
-        dialog = ConfigurationDialog(self.config, self.main_window)
-        if dialog.exec():
-            self.auto_restart_action.setChecked(self.config.auto_start_work_after_break) 
\ No newline at end of file
+        if ConfigurationDialog.get_or_create(self.config, self.main_window).exec():
+            self.auto_restart_action.setChecked(self.config.auto_start_work_after_break)
+            self._cache_durations()
+            self._schedule_repaint() 
\ No newline at end of file
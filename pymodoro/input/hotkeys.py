@@ -13,6 +13,11 @@ class GlobalHotkeyManager(QObject):
         self.logger = get_logger()
         self.listener = None
         self.is_active = False
+        # Pick the trigger log line once; test mode cannot change mid-run
+        if ConfigProvider.is_test_mode():
+            self._triggered_message = "Global hotkey triggered (test mode)"
+        else:
+            self._triggered_message = "Global hotkey triggered"
         
         # Start monitoring if enabled
         self.start_if_enabled()
@@ -61,12 +66,7 @@ class GlobalHotkeyManager(QObject):
         return parts
     
     def _on_hotkey_pressed(self):
-        # Clean check for test mode using ConfigProvider
-        if ConfigProvider.is_test_mode():
-            self.logger.info("Global hotkey triggered (test mode)")
-        else:
-            self.logger.info("Global hotkey triggered")
-        
+        self.logger.info(self._triggered_message)
         self.hotkey_triggered.emit()
     
     def update_hotkey(self, new_hotkey: str, enabled: bool):
@@ -17,6 +17,13 @@ class InputMonitor(QObject):
         self.mouse_listener = None
         self.keyboard_listener = None
         self.is_user_considered_idle = False
+        # Taken by the first activity callback; the listeners run on separate threads
+        self._fired = threading.Lock()
+        # Test mode is fixed for the run, so the log line is picked once
+        if ConfigProvider.is_test_mode():
+            self._activity_message = "User returned! Auto-starting next work session (test mode)"
+        else:
+            self._activity_message = "User activity detected - auto-starting work session"
     
     def _create_fresh_listeners(self):
         if self.mouse_listener:
@@ -53,6 +60,7 @@ class InputMonitor(QObject):
             self.logger.info("Starting input monitoring for auto-start")
             self.is_monitoring = True
             self.is_user_considered_idle = True  # Assume idle after break
+            self._fired = threading.Lock()
             
             try:
                 self._create_fresh_listeners()
@@ -91,10 +99,8 @@ class InputMonitor(QObject):
             self._record_activity()
     
     def _record_activity(self):
-        if self.is_user_considered_idle:
-            if ConfigProvider.is_test_mode():
-                self.logger.info("User returned! Auto-starting next work session (test mode)")
-            else:
-                self.logger.info("User activity detected - auto-starting work session")
+        # Non-blocking acquire is an atomic test-and-set, so only one event fires
+        if self.is_user_considered_idle and self._fired.acquire(blocking=False):
+            self.logger.info(self._activity_message)
             self.activity_detected.emit()
             self.stop_monitoring()  # Stop monitoring after triggering 
\ No newline at end of file
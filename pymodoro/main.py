@@ -2,21 +2,17 @@
 
 import sys
 import argparse
-from PyQt6.QtWidgets import QApplication
-from .app import PyomodoroApp
 from .config.provider import ConfigProvider, PersistentConfig, InMemoryConfig
 from .utils.logger import setup_logger, parse_log_level
 
+_DURATION_UNITS = {'s': 1, 'm': 60, 'h': 3600}
+
 def parse_duration(duration_str):
     """Parse duration string like '15s', '2m', '1h' into seconds"""
-    if duration_str.endswith('s'):
-        return int(duration_str[:-1])
-    elif duration_str.endswith('m'):
-        return int(duration_str[:-1]) * 60
-    elif duration_str.endswith('h'):
-        return int(duration_str[:-1]) * 3600
-    else:
+    unit = _DURATION_UNITS.get(duration_str[-1:])
+    if unit is None:
         return int(duration_str)
+    return int(duration_str[:-1]) * unit
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -48,8 +44,8 @@ Logging:
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
                        default='INFO', help='Set logging level (default: INFO)')
     parser.add_argument('--log-file', help='Custom log file path')
-    parser.add_argument('--no-clear-log', action='store_true', 
-                       help='Don\'t clear log file at startup')
+    # Sessions always append now; still accepted so existing launchers keep working
+    parser.add_argument('--no-clear-log', action='store_true', help=argparse.SUPPRESS)
     
     return parser.parse_args()
 
@@ -60,8 +56,7 @@ def main():
     log_level = parse_log_level(args.log_level)
     logger = setup_logger(
         level=log_level,
-        log_file=args.log_file,
-        clear_log=not args.no_clear_log
+        log_file=args.log_file
     )
     
     logger.info("Starting Pymodoro application")
@@ -101,6 +96,8 @@ def main():
     
     # Create and run the application
     try:
+        # Imported here so --help and argument errors don't pay for the GUI stack
+        from .app import PyomodoroApp
         pomodoro_app = PyomodoroApp()
         exit_code = pomodoro_app.run()
         logger.info(f"Application exited with code: {exit_code}")
@@ -3,6 +3,18 @@ from .core import PomodoroTimer
 from .states import TimerState
 from ..utils.logger import get_logger
 
+_RUNNING_STATES = frozenset({TimerState.WORK, TimerState.SHORT_BREAK, TimerState.LONG_BREAK})
+_BREAK_STATES = frozenset({TimerState.SHORT_BREAK, TimerState.LONG_BREAK})
+_STARTABLE_STATES = frozenset({TimerState.IDLE, TimerState.PAUSED})
+_PAUSABLE_STATES = _RUNNING_STATES | {TimerState.PAUSED}
+
+# (enabled, text) of the start and pause buttons per state
+_START_BUTTON = {TimerState.IDLE: (True, "Start"), TimerState.PAUSED: (True, "Resume")}
+_PAUSE_BUTTON = {state: (True, "Pause") for state in _RUNNING_STATES}
+_PAUSE_BUTTON[TimerState.PAUSED] = (True, "Resume")
+_START_DISABLED = (False, "Start")
+_PAUSE_DISABLED = (False, "Pause")
+
 class TimerController(QObject):
     """Centralized timer control logic - eliminates duplication across GUI components"""
     
@@ -28,7 +40,7 @@ class TimerController(QObject):
         """Smart pause/resume based on current state"""
         state = self.timer.current_state
         
-        if state in [TimerState.WORK, TimerState.SHORT_BREAK, TimerState.LONG_BREAK]:
+        if state in _RUNNING_STATES:
             self.logger.debug("Pausing timer from controller")
             self.timer.pause()
         elif state == TimerState.PAUSED:
@@ -44,38 +56,24 @@ class TimerController(QObject):
     
     def get_start_button_state(self) -> tuple[bool, str]:
         """Get start button enabled state and text"""
-        state = self.timer.current_state
-        
-        if state == TimerState.IDLE:
-            return True, "Start"
-        elif state == TimerState.PAUSED:
-            return True, "Resume"
-        else:
-            return False, "Start"
+        return _START_BUTTON.get(self.timer.current_state, _START_DISABLED)
     
     def get_pause_button_state(self) -> tuple[bool, str]:
         """Get pause button enabled state and text"""
-        state = self.timer.current_state
-        
-        if state in [TimerState.WORK, TimerState.SHORT_BREAK, TimerState.LONG_BREAK]:
-            return True, "Pause"
-        elif state == TimerState.PAUSED:
-            return True, "Resume"
-        else:
-            return False, "Pause"
+        return _PAUSE_BUTTON.get(self.timer.current_state, _PAUSE_DISABLED)
     
     def can_start(self) -> bool:
         """Check if timer can be started"""
-        return self.timer.current_state in [TimerState.IDLE, TimerState.PAUSED]
+        return self.timer.current_state in _STARTABLE_STATES
     
     def can_pause(self) -> bool:
         """Check if timer can be paused"""
-        return self.timer.current_state in [TimerState.WORK, TimerState.SHORT_BREAK, TimerState.LONG_BREAK, TimerState.PAUSED]
+        return self.timer.current_state in _PAUSABLE_STATES
     
     def is_running(self) -> bool:
         """Check if timer is actively running"""
-        return self.timer.current_state in [TimerState.WORK, TimerState.SHORT_BREAK, TimerState.LONG_BREAK]
+        return self.timer.current_state in _RUNNING_STATES
     
     def is_break_active(self) -> bool:
         """Check if a break is currently active"""
-        return self.timer.current_state in [TimerState.SHORT_BREAK, TimerState.LONG_BREAK] 
\ No newline at end of file
+        return self.timer.current_state in _BREAK_STATES 
\ No newline at end of file
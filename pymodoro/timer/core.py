@@ -1,10 +1,23 @@
+import math
+import time
+from typing import Optional
 from PyQt6.QtCore import QTimer, QObject, pyqtSignal
 from .states import TimerState, TimerEvent
 from ..config.provider import ConfigProvider
 
+# Preformatted "MM:SS" strings covering every duration the config allows (max 120 min)
+_TIME_STRINGS = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(120 * 60 + 1))
+
+def format_time(seconds: int) -> str:
+    """Format seconds as MM:SS, using the lookup table when in range"""
+    if 0 <= seconds < len(_TIME_STRINGS):
+        return _TIME_STRINGS[seconds]
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
 class PomodoroTimer(QObject):
     state_changed = pyqtSignal(TimerState)
     time_changed = pyqtSignal(int)
+    display_changed = pyqtSignal(str)
     session_completed = pyqtSignal(TimerState)
     
     def __init__(self, config=None):
@@ -12,19 +25,23 @@ class PomodoroTimer(QObject):
         self.config = config or ConfigProvider.get()
         self.current_state = TimerState.IDLE
         self.previous_state = TimerState.IDLE
-        self.remaining_seconds = 0
         self.current_session = 1
+        # Seconds left as of the last tick/pause; the live value comes from _deadline
+        self._remaining = 0
+        # Monotonic time at which the running session reaches zero, None unless running
+        self._deadline: Optional[float] = None
         
+        # Re-armed for each second boundary from the deadline, so ticks don't drift
         self.qt_timer = QTimer()
+        self.qt_timer.setSingleShot(True)
         self.qt_timer.timeout.connect(self._tick)
-        self.qt_timer.setInterval(1000)
     
     def start_work_session(self, from_hotkey=False):
         if self.current_state != TimerState.IDLE:
             return
             
         self._change_state(TimerState.WORK)
-        self.remaining_seconds = self.config.work_duration_seconds
+        self._remaining = self.config.work_duration_seconds
         self._start_timer()
     
     def start_break(self):
@@ -36,16 +53,16 @@ class PomodoroTimer(QObject):
         
         if is_long_break:
             self._change_state(TimerState.LONG_BREAK)
-            self.remaining_seconds = self.config.long_break_duration_seconds
+            self._remaining = self.config.long_break_duration_seconds
         else:
             self._change_state(TimerState.SHORT_BREAK)
-            self.remaining_seconds = self.config.short_break_duration_seconds
+            self._remaining = self.config.short_break_duration_seconds
         
         self._start_timer()
     
     def pause(self):
         if self.current_state in [TimerState.WORK, TimerState.SHORT_BREAK, TimerState.LONG_BREAK]:
-            self.qt_timer.stop()
+            self._stop_timer()
             self.previous_state = self.current_state
             self._change_state(TimerState.PAUSED)
     
@@ -55,25 +72,60 @@ class PomodoroTimer(QObject):
             self._start_timer()
     
     def reset(self):
-        self.qt_timer.stop()
+        self._stop_timer()
         self._change_state(TimerState.IDLE)
         self.previous_state = TimerState.IDLE
-        self.remaining_seconds = 0
+        self._remaining = 0
         self.current_session = 1
     
+    @property
+    def remaining_seconds(self) -> int:
+        """Whole seconds left, counting a partly elapsed second as a full one"""
+        if self._deadline is None:
+            return self._remaining
+        return max(0, math.ceil(self._deadline - time.monotonic()))
+    
     def _start_timer(self):
-        self.qt_timer.start()
-        self.time_changed.emit(self.remaining_seconds)
+        self._deadline = time.monotonic() + self._remaining
+        self._schedule_tick()
+        self._emit_time()
+    
+    def _stop_timer(self):
+        self.qt_timer.stop()
+        if self._deadline is not None:
+            self._remaining = self.remaining_seconds
+            self._deadline = None
+    
+    def _schedule_tick(self):
+        next_boundary = self._deadline - (self._remaining - 1)
+        self.qt_timer.start(max(0, int((next_boundary - time.monotonic()) * 1000)))
     
     def _tick(self):
-        self.remaining_seconds -= 1
-        self.time_changed.emit(self.remaining_seconds)
+        remaining = self.remaining_seconds
+        if remaining == self._remaining:
+            # Fired a little early; wait for the boundary
+            self._schedule_tick()
+            return
+        self._remaining = remaining
+        self._emit_time()
         
-        if self.remaining_seconds <= 0:
+        if remaining <= 0:
             self._timer_finished()
+        else:
+            self._schedule_tick()
+    
+    def extend(self, seconds: int):
+        self._remaining += seconds
+        if self._deadline is not None:
+            self._deadline += seconds
+        self._emit_time()
+    
+    def _emit_time(self):
+        self.time_changed.emit(self._remaining)
+        self.display_changed.emit(format_time(self._remaining))
     
     def _timer_finished(self):
-        self.qt_timer.stop()
+        self._stop_timer()
         current_state = self.current_state
         
         if current_state == TimerState.WORK:
@@ -91,6 +143,4 @@ class PomodoroTimer(QObject):
             self.state_changed.emit(new_state)
     
     def get_time_display(self) -> str:
-        minutes = self.remaining_seconds // 60
-        seconds = self.remaining_seconds % 60
-        return f"{minutes:02d}:{seconds:02d}" 
\ No newline at end of file
+        return format_time(self.remaining_seconds) 
\ No newline at end of file
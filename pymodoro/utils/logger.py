@@ -1,12 +1,48 @@
+import atexit
 import logging
 import os
+import queue
 import sys
+from functools import lru_cache
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-MAX_LOG_SIZE = 50 * 1024  # 50KB
+LOG_BACKUP_DAYS = 7
 
-def setup_logger(name="pymodoro", level=logging.INFO, log_file: Optional[str] = None, clear_log: bool = True):
+# Resolved once; honours XDG_CONFIG_HOME and falls back to ~/.config
+_DEFAULT_LOG_DIR = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config") / "pymodoro" / "logs"
+
+# Writes records to the real handlers off the calling thread; stopped at exit
+_LISTENER: Optional[QueueListener] = None
+
+_LEVEL_MAP = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+
+_FILE_FORMATTER = logging.Formatter(
+    '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_CONSOLE_FORMATTER = logging.Formatter('%(levelname)s: %(message)s')
+
+class _DrainFlushingListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs empty"""
+    
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+# get_logger results, so lookups skip logging's module lock
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
+
+def setup_logger(name="pymodoro", level=logging.INFO, log_file: Optional[str] = None):
     """
     Setup logger with file and console handlers
     
@@ -14,10 +50,22 @@ def setup_logger(name="pymodoro", level=logging.INFO, log_file: Optional[str] =
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Custom log file path (optional)
-        clear_log: Whether to clear the log file at startup
     """
+    return _build_logger(name, level, log_file)
+
+@lru_cache(maxsize=16)
+def _build_logger(name: str, level: int, log_file: Optional[str]) -> logging.Logger:
+    """Configure the logger once per argument combination"""
     logger = logging.getLogger(name)
     
+    # Our formats use none of thread, process or caller location (%(filename)s,
+    # %(lineno)d, ...), so skip collecting them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+    
+    # Still guards against a second setup with different arguments
     if logger.handlers:
         return logger
     
@@ -27,66 +75,58 @@ def setup_logger(name="pymodoro", level=logging.INFO, log_file: Optional[str] =
     if log_file:
         log_path = Path(log_file)
     else:
-        log_dir = Path.home() / ".config" / "pymodoro" / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
+        log_dir = _DEFAULT_LOG_DIR
+        # One stat on warm starts; mkdir only the first time
+        if not log_dir.is_dir():
+            log_dir.mkdir(parents=True, exist_ok=True)
         log_path = log_dir / "pymodoro.log"
     
-    # Check log file size and truncate if too large
-    if log_path.exists() and log_path.stat().st_size > MAX_LOG_SIZE:
-        # Keep only the last 25KB (half the limit)
-        with open(log_path, 'rb') as f:
-            f.seek(-25 * 1024, 2)  # Seek to 25KB from end
-            content = f.read()
-        
-        with open(log_path, 'wb') as f:
-            f.write(b'\n--- LOG TRUNCATED ---\n')
-            f.write(content)
-    
-    # Clear log file at startup if requested
-    if clear_log and log_path.exists():
-        log_path.unlink()
-    
-    # File handler for persistent logging
-    file_handler = logging.FileHandler(log_path)
+    # File handler for persistent logging; sessions append and the file rolls over
+    # at midnight, keeping the last LOG_BACKUP_DAYS days
+    file_handler = TimedRotatingFileHandler(log_path, when='midnight', backupCount=LOG_BACKUP_DAYS,
+                                            encoding='utf-8', delay=True, utc=False)
     file_handler.setLevel(logging.DEBUG)  # Always log everything to file
-    file_formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(file_formatter)
+    file_handler.setFormatter(_FILE_FORMATTER)
+    # Batch file writes during bursts; records sit in memory only until the queue
+    # drains, 16 pile up or a WARNING or above arrives
+    buffered_file_handler = MemoryHandler(capacity=16, flushLevel=logging.WARNING,
+                                          target=file_handler, flushOnClose=True)
+    buffered_file_handler.setLevel(logging.DEBUG)
+    atexit.register(buffered_file_handler.close)
     
     # Console handler for immediate feedback
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
-    console_formatter = logging.Formatter('%(levelname)s: %(message)s')
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Callers only enqueue records; the listener thread does the formatting and I/O
+    global _LISTENER
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _LISTENER = _DrainFlushingListener(log_queue, buffered_file_handler, console_handler, respect_handler_level=True)
+    _LISTENER.start()
+    atexit.register(_LISTENER.stop)
     
     # Log startup info
-    logger.info(f"Pymodoro logging initialized - log file: {log_path}")
-    logger.debug(f"Console log level: {logging.getLevelName(level)}")
-    logger.debug(f"File log level: DEBUG")
-    logger.debug(f"Max log size: {MAX_LOG_SIZE // 1024}KB")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Pymodoro logging initialized - log file: %s", log_path)
+        logger.debug("Console log level: %s", logging.getLevelName(level))
+        logger.debug("File log level: DEBUG")
+        logger.debug("Log backups kept: %d days", LOG_BACKUP_DAYS)
     
     return logger
 
 def get_logger(name: str = "pymodoro") -> logging.Logger:
     """Get existing logger instance"""
-    return logging.getLogger(name)
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        logger = _LOGGER_CACHE[name] = logging.getLogger(name)
+    return logger
 
 def log_exception(logger: logging.Logger, message: str, exc_info=True):
     """Helper to log exceptions with context"""
-    logger.error(f"{message}", exc_info=exc_info)
+    logger.error(message, exc_info=exc_info)
 
 def parse_log_level(level_str: str) -> int:
     """Parse log level string to logging constant"""
-    level_map = {
-        'DEBUG': logging.DEBUG,
-        'INFO': logging.INFO,
-        'WARNING': logging.WARNING,
-        'ERROR': logging.ERROR,
-        'CRITICAL': logging.CRITICAL
-    }
-    return level_map.get(level_str.upper(), logging.INFO) 
\ No newline at end of file
+    return _LEVEL_MAP.get(level_str.upper(), logging.INFO) 
\ No newline at end of file